@@ -1,20 +1,28 @@
 import streamlit as st
-import plotly.express as px
+import numpy as np
+import pandas as pd
 from streamlit_option_menu import option_menu
 from typing import Dict
-import time
+import html
+from collections import OrderedDict
+from operator import itemgetter
 import random
 from datetime import datetime
+from pathlib import Path
 
 # Import our core modules
-from core.config import (
-    RATING_LABELS,
-    TMDB_IMAGE_BASE_URL,
+from core.config import RATING_LABELS
+from core.tmdb_api import (
+    fetch_concurrently,
+    get_tmdb_api,
+    get_popular_movies_cached,
+    get_popular_tv_cached,
+    search_movies_cached,
+    poster_url,
+    search_tv_cached,
+    shorten_overview,
 )
-from core.tmdb_api import TMDBApi
 from core.enhanced_ratings_manager import EnhancedRatingsManager
-from core.dynamic_recommendations import DynamicRecommendationManager
-# Swipe interface imported dynamically in functions
 
 # Page configuration
 st.set_page_config(
@@ -24,456 +32,281 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Mobile-first responsive CSS styling
-st.markdown(
-    """
-<style>
-/* Reset and base styles */
-.main .block-container {
-    padding: 0.5rem;
-    max-width: 100%;
-}
 
-/* Header styling - responsive */
-.main-header {
-    font-size: 2.5rem;
-    font-weight: bold;
-    text-align: center;
-    background: linear-gradient(90deg, #FF6B6B, #4ECDC4, #45B7D1);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    margin-bottom: 1.5rem;
-    line-height: 1.2;
-}
+@st.cache_resource
+def get_ratings_manager():
+    """Cached ratings manager initialization"""
+    return EnhancedRatingsManager()
 
-.subtitle {
-    text-align: center;
-    font-size: 1rem;
-    color: #666;
-    margin-bottom: 1.5rem;
-    padding: 0 1rem;
-}
-
-/* Movie cards - mobile first */
-.movie-card {
-    background: white;
-    border-radius: 12px;
-    padding: 1rem;
-    margin: 0.8rem 0;
-    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-    border-left: 4px solid #FF6B6B;
-    transition: transform 0.2s ease;
-}
-
-.movie-card:hover {
-    transform: translateY(-1px);
-    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-}
 
-.already-rated {
-    background: linear-gradient(135deg, #ffeaa7 0%, #fdcb6e 100%);
-    padding: 0.8rem;
-    border-radius: 8px;
-    margin: 0.5rem 0;
-    border-left: 4px solid #fdcb6e;
-    font-size: 0.9rem;
-}
-
-/* Responsive columns */
-.stColumns > div {
-    padding: 0.2rem !important;
-}
-
-/* Button styling - touch friendly */
-.stButton > button {
-    width: 100% !important;
-    font-size: 0.85rem !important;
-    padding: 0.6rem 0.4rem !important;
-    margin: 0.1rem 0 !important;
-    border-radius: 8px !important;
-    min-height: 44px !important; /* iOS touch target minimum */
-    font-weight: 600 !important;
-    transition: all 0.2s ease !important;
-}
+@st.cache_resource
+def get_swipe_interface():
+    """Cached swipe interface - it holds no per-session state"""
+    # Imported on first use so the other pages don't load the swipe module
+    from apps.swipe_interface import SwipeInterface
 
-.stButton > button:hover {
-    transform: translateY(-1px) !important;
-}
+    return SwipeInterface(get_ratings_manager())
 
-/* Rating buttons specific styling */
-.rating-buttons .stButton > button {
-    font-size: 0.75rem !important;
-    padding: 0.5rem 0.2rem !important;
-    min-height: 40px !important;
-}
 
-/* Stats cards - mobile optimized */
-.stats-card {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    color: white;
-    padding: 1rem;
-    border-radius: 8px;
-    text-align: center;
-    margin: 0.3rem 0;
-}
+# Mobile-first responsive CSS styling
+@st.cache_resource
+def _legacy_css() -> str:
+    """Build the legacy app <style> block once per server process"""
+    css = (Path(__file__).parent.parent / "assets" / "legacy.css").read_text()
+    return f"<style>{css}</style>"
 
-/* Sidebar improvements */
-.css-1d391kg {
-    padding-top: 1rem;
-}
 
-/* Search input */
-.stTextInput > div > div > input {
-    font-size: 1rem !important;
-    padding: 0.8rem !important;
-}
+# Emitted on every run: Streamlit removes elements a rerun doesn't re-emit
+st.markdown(_legacy_css(), unsafe_allow_html=True)
 
-/* Selectbox */
-.stSelectbox > div > div > select {
-    font-size: 1rem !important;
-    padding: 0.8rem !important;
-}
+# Session state will be initialized in main() function
 
-/* Metrics */
-[data-testid="metric-container"] {
-    background-color: rgba(28, 131, 225, 0.1);
-    border: 1px solid rgba(28, 131, 225, 0.2);
-    padding: 0.8rem;
-    border-radius: 8px;
-    margin: 0.3rem 0;
-}
 
-/* Footer */
-.footer {
-    text-align: center;
-    color: #666;
-    font-style: italic;
-    margin-top: 2rem;
-    padding: 1rem;
-    border-top: 1px solid #eee;
-    font-size: 0.9rem;
-}
+# (rating, label, help) for the After Watching buttons on content cards
+_RATING_BUTTONS = (
+    (1, "😤 Hate", "Rate as Hate"),
+    (2, "🤷 OK", "Rate as OK"),
+    (3, "👍 Good", "Rate as Good"),
+    (4, "🌟 Perfect", "Rate as Perfect"),
+)
 
-/* Desktop improvements */
-@media (min-width: 769px) {
-    .main .block-container {
-        padding: 1rem 2rem;
-        max-width: 1200px;
-    }
+# (rating, label, key prefix, help, toast) for the Before Watching buttons
+_BEFORE_WATCHING_BUTTONS = (
+    (0, "👀 Want to See", "want", "Add to watchlist", "✅ Added to watchlist!"),
+    (
+        -1,
+        "❌ Don't Want to See",
+        "dont_want",
+        "Mark as not interested",
+        "✅ Marked as not interested!",
+    ),
+)
 
-    .main-header {
-        font-size: 3.5rem;
-    }
+# TMDB score indicator indexed by the whole-number part of vote_average (0-10)
+_TMDB_SCORE_COLORS = ("🔴",) * 6 + ("🟠", "🟡", "🟢", "🟢", "🟢")
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_ratings(version: int):
+    """All ratings as a DataFrame, rebuilt only when the manager saves"""
+    df = st.session_state.ratings_manager.get_all_ratings()
+    # Compact dtypes once here so every page filters and sorts the small forms
+    rating = pd.to_numeric(df["my_rating"], errors="coerce")
+    # Blank/unparseable ratings (e.g. empty Sheets cells) aren't ratings at all;
+    # filling them would count them as 0 = Watchlist
+    df = df[rating.notna()].copy()
+    df["my_rating"] = rating.dropna().astype("int8")
+    df["type"] = df["type"].astype("category")
+    df["date_rated"] = pd.to_datetime(
+        df["date_rated"], format="ISO8601", errors="coerce"
+    )
+    return df
 
-    .subtitle {
-        font-size: 1.3rem;
-    }
 
-    .movie-card {
-        padding: 1.5rem;
-        margin: 1.2rem 0;
-    }
+def get_ratings_df():
+    """Cached ratings DataFrame keyed on the ratings manager's version"""
+    return _load_ratings(st.session_state.ratings_manager.version)
 
-    .stButton > button {
-        font-size: 1rem !important;
-        padding: 0.7rem 1rem !important;
-    }
 
-    .rating-buttons .stButton > button {
-        font-size: 0.9rem !important;
-        padding: 0.6rem 0.8rem !important;
-    }
+@st.cache_data(show_spinner=False, max_entries=4)
+def _sidebar_stats(version: int):
+    """(total, watched, watchlist) counts for the sidebar Quick Stats"""
+    ratings = _load_ratings(version)["my_rating"]
+    return len(ratings), int((ratings > 0).sum()), int((ratings == 0).sum())
 
-    .stats-card {
-        padding: 1.5rem;
-    }
-}
 
-/* Extra large screens */
-@media (min-width: 1200px) {
-    .main .block-container {
-        max-width: 1400px;
-    }
+@st.cache_data(show_spinner=False, max_entries=2)
+def _ratings_csv(version: int) -> bytes:
+    """The ratings file contents for export, serialized once per version"""
+    # Export the stored rows as-is rather than the display dtypes above
+    return st.session_state.ratings_manager.get_all_ratings().to_csv(index=False).encode()
 
-    .main-header {
-        font-size: 4rem;
-    }
-}
 
-/* Tablet specific */
-@media (min-width: 481px) and (max-width: 768px) {
-    .main-header {
-        font-size: 3rem;
-    }
+# Compact styled placeholder for cards without a usable poster
+_POSTER_PLACEHOLDER_HTML = '<div class="card-thumb card-thumb-placeholder">🎬</div>'
 
-    .stButton > button {
-        font-size: 0.95rem !important;
-        padding: 0.65rem 0.8rem !important;
-    }
-}
 
-/* Small phone specific */
-@media (max-width: 480px) {
-    .main .block-container {
-        padding: 0.3rem;
-    }
+def _poster_html(item: Dict) -> str:
+    """Poster thumbnail tag for a card, or the placeholder if there isn't one"""
+    if item.get("poster_path") and item["poster_path"] != "None":
+        src = html.escape(poster_url(item["poster_path"], 80))
+        return f'<img class="card-thumb" src="{src}" alt="" width="80" loading="lazy">'
+    return _POSTER_PLACEHOLDER_HTML
 
-    .main-header {
-        font-size: 2rem;
-        margin-bottom: 1rem;
-    }
 
-    .subtitle {
-        font-size: 0.9rem;
-        margin-bottom: 1rem;
-    }
+def _card_details(item: Dict, existing_rating=None) -> str:
+    """Build the markdown for a card's poster, title, badges, genres and plot"""
+    # The thumbnail floats left of the text, replacing a poster/title column pair
+    parts = [_poster_html(item), f"### {item['title']}"]
 
-    .movie-card {
-        padding: 0.8rem;
-        margin: 0.5rem 0;
-    }
+    # Show if already rated
+    if existing_rating and existing_rating > 0:
+        rating_label = RATING_LABELS.get(existing_rating, "Unknown")
+        parts.append(
+            f'<div class="already-rated">✅ <strong>You rated this: {rating_label}</strong></div>'
+        )
 
-    .stButton > button {
-        font-size: 0.8rem !important;
-        padding: 0.5rem 0.3rem !important;
-        min-height: 42px !important;
-    }
+    # Rating and basic info
+    rating = item.get("vote_average", 0)
+    color = _TMDB_SCORE_COLORS[min(max(int(rating), 0), 10)]
+    year = item.get("release_date", "")[:4] if item.get("release_date") else "N/A"
+    content_type = "🎬 Movie" if item["type"] == "movie" else "📺 TV Show"
+    parts.append(
+        f"{color} **TMDB: {rating:.1f}/10** &nbsp;&nbsp; 📅 **{year}** &nbsp;&nbsp; {content_type}"
+    )
 
-    .rating-buttons .stButton > button {
-        font-size: 0.7rem !important;
-        padding: 0.4rem 0.1rem !important;
-        min-height: 38px !important;
-    }
-}
-</style>
-""",
-    unsafe_allow_html=True,
-)
+    # Show recommendation reason if available
+    if item.get("rec_reason"):
+        match_score = item.get("final_score", 0.5) * 100
+        parts.append(f"> 🎯 **{item['rec_reason']}** (Match: {match_score:.0f}%)")
+
+    # Language info (very important!)
+    if item.get("language_name"):
+        parts.append(f"🌍 **Language:** {item['language_name']}")
+    elif item.get("original_language"):
+        parts.append(f"🌍 **Language:** {item['original_language'].upper()}")
+
+    # Genres
+    if item.get("genres"):
+        genres_text = " ".join([f"`{genre}`" for genre in item["genres"][:3]])
+        parts.append(f"**Genres:** {genres_text}")
+
+    # Overview
+    overview = item.get("overview_short") or shorten_overview(
+        item.get("overview", "No overview available")
+    )
+    parts.append(f"**Plot:** {overview}")
+    parts.append('<div class="card-clear"></div>')
 
-# Session state will be initialized in main() function
+    # One markdown element, so the movie-card div really wraps the card
+    # (a lone opening tag in its own st.markdown is closed on the spot)
+    return '<div class="movie-card">\n\n' + "\n\n".join(parts) + "\n\n</div>"
 
 
 def display_content_card(item: Dict, show_actions: bool = True):
-    """Display a compact, beautiful movie/TV show card"""
-    st.markdown('<div class="movie-card">', unsafe_allow_html=True)
-
-    # Check if already rated (with safety check)
-    already_rated = False
-    if (
-        hasattr(st.session_state, "ratings_manager")
-        and st.session_state.ratings_manager
-    ):
+    """Display a compact, beautiful movie/TV show card
+
+    Always rendered inside the _render_card fragment, so its buttons rerun
+    just that fragment.
+    """
+    # Look up any existing rating once (with safety check); an empty map
+    # means nothing is rated yet, so the per-card lookup is skipped
+    rating_map = None
+    if getattr(st.session_state, "ratings_manager", None):
         try:
-            already_rated = st.session_state.ratings_manager.is_already_rated(
-                item["id"], item["type"]
-            )
+            rating_map = st.session_state.ratings_manager.get_rating_map()
         except Exception:
-            already_rated = False
-
-    # Compact header with poster thumbnail and title
-    col_poster, col_title = st.columns([1, 5])
-
-    with col_poster:
-        if item.get("poster_path") and item["poster_path"] != "None":
-            try:
-                st.image(item["poster_path"], width=80)
-            except Exception:
-                # Compact fallback icon
-                st.markdown(
-                    """
-                    <div style="
-                        width: 80px; 
-                        height: 120px; 
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        border-radius: 6px;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        color: white;
-                        font-size: 24px;
-                    ">
-                        🎬
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
-        else:
-            # Compact styled placeholder
-            st.markdown(
-                """
-                <div style="
-                    width: 80px; 
-                    height: 120px; 
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    border-radius: 6px;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    color: white;
-                    font-size: 24px;
-                ">
-                    🎬
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-
-    with col_title:
-        st.markdown(f"### {item['title']}")
-
-        # Show if already rated
-        if already_rated:
-            existing_rating = st.session_state.ratings_manager.get_user_rating(
-                item["id"], item["type"]
-            )
-            if existing_rating and existing_rating > 0:
-                rating_label = RATING_LABELS.get(existing_rating, "Unknown")
-                st.markdown(
-                    f'<div class="already-rated">✅ <strong>You rated this: {rating_label}</strong></div>',
-                    unsafe_allow_html=True,
-                )
-
-        # Rating and basic info
-        col_rating, col_year, col_type = st.columns(3)
-        with col_rating:
-            rating = item.get("vote_average", 0)
-            if rating >= 8:
-                color = "🟢"
-            elif rating >= 7:
-                color = "🟡"
-            elif rating >= 6:
-                color = "🟠"
-            else:
-                color = "🔴"
-            st.markdown(f"{color} **TMDB: {rating:.1f}/10**")
-
-        with col_year:
-            year = (
-                item.get("release_date", "")[:4] if item.get("release_date") else "N/A"
-            )
-            st.markdown(f"📅 **{year}**")
-
-        with col_type:
-            content_type = "🎬 Movie" if item["type"] == "movie" else "📺 TV Show"
-            st.markdown(f"{content_type}")
-
-        # Show recommendation reason if available
-        if item.get("rec_reason"):
-            match_score = item.get("final_score", 0.5) * 100
-            st.info(f"🎯 **{item['rec_reason']}** (Match: {match_score:.0f}%)")
-
-        # Language info (very important!)
-        if item.get("language_name"):
-            st.markdown(f"🌍 **Language:** {item['language_name']}")
-        elif item.get("original_language"):
-            st.markdown(f"🌍 **Language:** {item['original_language'].upper()}")
-
-        # Genres
-        if item.get("genres"):
-            genres_text = " ".join([f"`{genre}`" for genre in item["genres"][:3]])
-            st.markdown(f"**Genres:** {genres_text}")
-
-        # Overview
-        overview = item.get("overview", "No overview available")
-        if len(overview) > 300:
-            overview = overview[:300] + "..."
-        st.markdown(f"**Plot:** {overview}")
-
-        # Rating buttons
-        if show_actions:
-            st.markdown("**Rate this content:**")
-            st.markdown('<div class="rating-buttons">', unsafe_allow_html=True)
-
-            # After watching ratings
-            st.markdown("*After Watching:*")
-            col1, col2, col3, col4 = st.columns(4)
-
-            watched_ratings = [
-                (1, "😤 Hate", "#FF4444"),
-                (2, "🤷 OK", "#FFA500"),
-                (3, "👍 Good", "#32CD32"),
-                (4, "🌟 Perfect", "#FFD700"),
-            ]
-
-            for i, (rating_value, label, color) in enumerate(watched_ratings):
-                col = [col1, col2, col3, col4][i]
-                with col:
-                    if st.button(
-                        label,
-                        key=f"rate_{item['id']}_{item['type']}_{rating_value}",
-                        help=f"Rate as {label.split(' ')[1]}",
-                    ):
-                        try:
-                            success = st.session_state.ratings_manager.add_rating(
-                                item["id"],
-                                item["title"],
-                                item["type"],
-                                rating_value,
-                                item,
-                            )
-                            if success:
-                                if already_rated:
-                                    st.success(f"✅ Updated rating to {label}!")
-                                else:
-                                    st.success(
-                                        f"✅ Rated as {label}! This will improve your recommendations."
-                                    )
-                                time.sleep(1)
-                                st.rerun()
-                            else:
-                                st.error("❌ Failed to save rating. Please try again.")
-                        except Exception as e:
-                            st.error(f"❌ Error saving rating: {str(e)}")
-
-            # Before watching decisions
-            st.markdown("*Before Watching:*")
-            col1, col2 = st.columns(2)
-
-            with col1:
+            rating_map = None
+    existing_rating = rating_map.get((item["id"], item["type"])) if rating_map else None
+    already_rated = existing_rating is not None
+
+    # Poster and all static details go out as one markdown element
+    st.markdown(_card_details(item, existing_rating), unsafe_allow_html=True)
+
+    # Rating buttons
+    if show_actions:
+        # Every button key on this card shares the "<id>_<type>" suffix
+        rid = f"{item['id']}_{item['type']}"
+        st.markdown("**Rate this content:**")
+        st.markdown('<div class="rating-buttons">', unsafe_allow_html=True)
+
+        # After watching ratings
+        st.markdown("*After Watching:*")
+        for col, (rating_value, label, help_text) in zip(
+            st.columns(4), _RATING_BUTTONS
+        ):
+            with col:
                 if st.button(
-                    "👀 Want to See",
-                    key=f"want_{item['id']}_{item['type']}",
-                    help="Add to watchlist",
+                    label,
+                    key=f"rate_{rid}_{rating_value}",
+                    help=help_text,
                 ):
                     try:
                         success = st.session_state.ratings_manager.add_rating(
                             item["id"],
                             item["title"],
                             item["type"],
-                            0,
+                            rating_value,
                             item,
                         )
                         if success:
-                            st.success("✅ Added to watchlist!")
-                            time.sleep(1)
-                            st.rerun()
+                            # Toasts survive the rerun, so no need to pause first
+                            if already_rated:
+                                st.toast(f"✅ Updated rating to {label}!")
+                            else:
+                                st.toast(
+                                    f"✅ Rated as {label}! This will improve your recommendations."
+                                )
+                            st.rerun(scope="fragment")
+                        else:
+                            st.error("❌ Failed to save rating. Please try again.")
                     except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
-
-            with col2:
+                        st.error(f"❌ Error saving rating: {str(e)}")
+
+        # Before watching decisions
+        st.markdown("*Before Watching:*")
+        for col, (rating_value, label, key_prefix, help_text, message) in zip(
+            st.columns(2), _BEFORE_WATCHING_BUTTONS
+        ):
+            with col:
                 if st.button(
-                    "❌ Don't Want to See",
-                    key=f"dont_want_{item['id']}_{item['type']}",
-                    help="Mark as not interested",
+                    label,
+                    key=f"{key_prefix}_{rid}",
+                    help=help_text,
                 ):
                     try:
                         success = st.session_state.ratings_manager.add_rating(
                             item["id"],
                             item["title"],
                             item["type"],
-                            -1,
+                            rating_value,
                             item,
                         )
                         if success:
-                            st.success("✅ Marked as not interested!")
-                            time.sleep(1)
-                            st.rerun()
+                            st.toast(message)
+                            st.rerun(scope="fragment")
                     except Exception as e:
                         st.error(f"❌ Error: {str(e)}")
 
-            st.markdown("</div>", unsafe_allow_html=True)  # Close rating-buttons div
+        st.markdown("</div>", unsafe_allow_html=True)  # Close rating-buttons div
+
+
+# Formatted TMDB items kept per session (a few pages of results)
+_FORMATTED_MAX = 200
 
-    st.markdown("</div>", unsafe_allow_html=True)  # Close movie-card div
+
+def _format_results(response, content_type: str, limit: int = 10):
+    """Format the first results of a TMDB list response into display dicts"""
+    # Created on first use by the cached getter, not up front in main()
+    tmdb = get_tmdb_api()
+    # The format_* methods also resolve genres and language names
+    formatter = tmdb.format_movie_data if content_type == "movie" else tmdb.format_tv_data
+    # TMDB ids are stable, so formatted items are reused across pages and
+    # reruns - in a small LRU so a long session of searches doesn't grow it
+    formatted = st.session_state.setdefault("_formatted", OrderedDict())
+
+    results = []
+    for raw in (response or {}).get("results", [])[:limit]:
+        key = (content_type, raw["id"])
+        if key in formatted:
+            formatted.move_to_end(key)
+        else:
+            formatted[key] = formatter(raw)
+            if len(formatted) > _FORMATTED_MAX:
+                formatted.popitem(last=False)
+        results.append(formatted[key])
+    return results
+
+
+@st.fragment
+def _render_card(item: Dict):
+    """Content card that reruns on its own when one of its buttons is used
+
+    Every page that lists cards goes through this wrapper, so rating one card
+    never refetches or rebuilds the rest of the page.
+    """
+    # Rating lookups happen inside so a fragment rerun sees the new rating
+    display_content_card(item)
 
 
 def show_discover_page():
@@ -494,42 +327,43 @@ def show_discover_page():
     # Get trending content
     try:
         all_content = []
+        want_movies = content_type in ["Both Movies & TV Shows", "Movies Only"]
+        want_tv = content_type in ["Both Movies & TV Shows", "TV Shows Only"]
 
-        if content_type in ["Both Movies & TV Shows", "Movies Only"]:
-            movies = st.session_state.tmdb.get_popular_movies()
-            for movie in movies.get("results", [])[:10]:
-                # Use the proper formatting method to get language info
-                movie_data = st.session_state.tmdb.format_movie_data(movie)
-                all_content.append(movie_data)
+        # Fetch both lists at once so the page waits for the slower request only
+        movies, tv_shows = fetch_concurrently(
+            get_popular_movies_cached if want_movies else dict,
+            get_popular_tv_cached if want_tv else dict,
+        )
 
-        if content_type in ["Both Movies & TV Shows", "TV Shows Only"]:
-            tv_shows = st.session_state.tmdb.get_popular_tv()
-            for show in tv_shows.get("results", [])[:10]:
-                # Use the proper formatting method to get language info
-                show_data = st.session_state.tmdb.format_tv_data(show)
-                all_content.append(show_data)
+        if want_movies:
+            all_content += _format_results(movies, "movie")
 
-        # Shuffle for variety
-        random.shuffle(all_content)
+        if want_tv:
+            all_content += _format_results(tv_shows, "tv")
 
         # Filter out already rated content (optional)
         show_rated = st.checkbox("Show content you've already rated", value=False)
 
-        if not show_rated:
-            filtered_content = []
-            for item in all_content:
-                if not st.session_state.ratings_manager.is_already_rated(
-                    item["id"], item["type"]
-                ):
-                    filtered_content.append(item)
-            all_content = filtered_content
+        # Filter first, then sample from what's left; cards look up their own
+        # rating in the manager's memo
+        rating_map = st.session_state.ratings_manager.get_rating_map()
+        if show_rated or not rating_map:
+            pool = all_content
+        else:
+            pool = [
+                item
+                for item in all_content
+                if (item["id"], item["type"]) not in rating_map
+            ]
 
         # Display content
-        if all_content:
-            st.markdown(f"### 🎯 Trending Content ({len(all_content)} items)")
+        if pool:
+            st.markdown(f"### 🎯 Trending Content ({len(pool)} items)")
 
-            for item in all_content[:12]:  # Show top 12
-                display_content_card(item)
+            # Random pick of up to 12 for variety
+            for item in random.sample(pool, min(12, len(pool))):
+                _render_card(item)
                 st.markdown("---")
         else:
             st.info(
@@ -554,23 +388,17 @@ def show_search_page():
     if search_query:
         try:
             # Search both movies and TV shows
-            movie_results = st.session_state.tmdb.search_movies(search_query)
-            tv_results = st.session_state.tmdb.search_tv(search_query)
-
-            all_results = []
-
-            # Process movie results
-            for movie in movie_results.get("results", [])[:10]:
-                movie_data = st.session_state.tmdb.format_movie_data(movie)
-                all_results.append(movie_data)
+            movie_results, tv_results = fetch_concurrently(
+                lambda: search_movies_cached(search_query),
+                lambda: search_tv_cached(search_query),
+            )
 
-            # Process TV results
-            for show in tv_results.get("results", [])[:10]:
-                show_data = st.session_state.tmdb.format_tv_data(show)
-                all_results.append(show_data)
+            all_results = _format_results(movie_results, "movie") + _format_results(
+                tv_results, "tv"
+            )
 
             # Sort by rating
-            all_results.sort(key=lambda x: x.get("vote_average", 0), reverse=True)
+            all_results.sort(key=itemgetter("vote_average"), reverse=True)
 
             if all_results:
                 st.markdown(
@@ -578,7 +406,7 @@ def show_search_page():
                 )
 
                 for item in all_results:
-                    display_content_card(item)
+                    _render_card(item)
                     st.markdown("---")
             else:
                 st.info(
@@ -597,25 +425,24 @@ def show_quick_discovery_page():
     )
 
     # Initialize discovery state
-    if "discovery_index" not in st.session_state:
-        st.session_state.discovery_index = 0
+    st.session_state.setdefault("discovery_index", 0)
 
     try:
         # Get popular movies
-        movies = st.session_state.tmdb.get_popular_movies()
-        movie_list = movies.get("results", [])
+        movies = get_popular_movies_cached()
+        movie_list = (movies or {}).get("results", [])
 
         if not movie_list:
             st.error("No movies available for discovery.")
             return
 
         # Filter out already rated movies
-        unrated_movies = []
-        for movie in movie_list:
-            if not st.session_state.ratings_manager.is_already_rated(
-                movie["id"], "movie"
-            ):
-                unrated_movies.append(movie)
+        rated = st.session_state.ratings_manager.get_rated_id_set()
+        unrated_movies = (
+            [movie for movie in movie_list if (movie["id"], "movie") not in rated]
+            if rated
+            else movie_list
+        )
 
         if not unrated_movies:
             st.success(
@@ -633,9 +460,7 @@ def show_quick_discovery_page():
 
         with col1:
             if current_movie.get("poster_path"):
-                st.image(
-                    f"{TMDB_IMAGE_BASE_URL}{current_movie['poster_path']}", width=200
-                )
+                st.image(poster_url(current_movie["poster_path"], 200), width=200)
 
         with col2:
             st.markdown(f"### {current_movie['title']}")
@@ -653,24 +478,7 @@ def show_quick_discovery_page():
         st.markdown("---")
 
         # Main rating buttons (after watching)
-        st.markdown("**After Watching:**")
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            if st.button("😍 Perfect", key="perfect", use_container_width=True):
-                rate_and_next(current_movie, 4)
-
-        with col2:
-            if st.button("👍 Good", key="good", use_container_width=True):
-                rate_and_next(current_movie, 3)
-
-        with col3:
-            if st.button("😐 OK", key="ok", use_container_width=True):
-                rate_and_next(current_movie, 2)
-
-        with col4:
-            if st.button("👎 Hate", key="hate", use_container_width=True):
-                rate_and_next(current_movie, 1)
+        _rating_grid(current_movie)
 
         # Pre-watch decisions
         st.markdown("**Before Watching:**")
@@ -701,6 +509,25 @@ def show_quick_discovery_page():
         st.error(f"Error in Quick Discovery: {e}")
 
 
+# (label, key, rating) for the After Watching grid
+_QUICK_RATINGS = (
+    ("😍 Perfect", "perfect", 4),
+    ("👍 Good", "good", 3),
+    ("😐 OK", "ok", 2),
+    ("👎 Hate", "hate", 1),
+)
+
+
+@st.fragment
+def _rating_grid(movie):
+    """After Watching buttons, rerun on their own until a rating is submitted"""
+    st.markdown("**After Watching:**")
+    for col, (label, key, rating) in zip(st.columns(4), _QUICK_RATINGS):
+        with col:
+            if st.button(label, key=key, use_container_width=True):
+                rate_and_next(movie, rating)
+
+
 def rate_and_next(movie, rating):
     """Rate current movie and move to next"""
     movie_data = {
@@ -718,7 +545,8 @@ def rate_and_next(movie, rating):
         movie["id"], movie["title"], "movie", rating, movie_data
     )
 
-    st.success(f"Rated '{movie['title']}' as {RATING_LABELS[rating]}!")
+    # A toast survives the rerun below; st.success would vanish before it shows
+    st.toast(f"Rated '{movie['title']}' as {RATING_LABELS[rating]}!", icon="⭐")
     next_movie()
 
 
@@ -728,6 +556,17 @@ def next_movie():
     st.rerun()
 
 
+def _ensure_dynamic_rec_manager():
+    """Create this session's recommendation manager on first use"""
+    if 'dynamic_rec_manager' not in st.session_state:
+        # Imported here so pages that never recommend skip loading the engine
+        from core.dynamic_recommendations import DynamicRecommendationManager
+
+        st.session_state.dynamic_rec_manager = DynamicRecommendationManager(
+            st.session_state.ratings_manager
+        )
+
+
 def show_home_page():
     """Full-screen swipe interface"""
     # Remove default streamlit padding for full-screen experience
@@ -743,10 +582,7 @@ def show_home_page():
     """, unsafe_allow_html=True)
     
     # Initialize dynamic recommendation manager
-    if 'dynamic_rec_manager' not in st.session_state:
-        st.session_state.dynamic_rec_manager = DynamicRecommendationManager(
-            st.session_state.ratings_manager
-        )
+    _ensure_dynamic_rec_manager()
     
     # Create enhanced swipe interface
     create_enhanced_swipe_page()
@@ -758,8 +594,7 @@ def create_enhanced_swipe_page():
     st.markdown("*Discover your next favorite film*")
     
     # Get fresh recommendations including new releases
-    if 'swipe_recommendations' not in st.session_state:
-        st.session_state.swipe_recommendations = []
+    st.session_state.setdefault('swipe_recommendations', [])
     
     # Load more recommendations if needed
     if len(st.session_state.swipe_recommendations) < 5:
@@ -773,13 +608,12 @@ def create_enhanced_swipe_page():
     with col1:
         st.metric("Ready to Swipe", len(st.session_state.swipe_recommendations))
     with col2:
-        total_ratings = len(st.session_state.ratings_manager.get_all_ratings())
+        ratings_df = get_ratings_df()
+        total_ratings = len(ratings_df)
         st.metric("Your Ratings", total_ratings)
     with col3:
         if total_ratings > 0:
-            perfect_count = len(st.session_state.ratings_manager.get_all_ratings()[
-                st.session_state.ratings_manager.get_all_ratings()["my_rating"] == 4
-            ])
+            perfect_count = int((ratings_df["my_rating"] == 4).sum())
             st.metric("Perfect Picks", perfect_count)
         else:
             st.metric("Getting Started", "Rate to unlock")
@@ -787,8 +621,7 @@ def create_enhanced_swipe_page():
     st.markdown("---")
     
     # Enhanced swipe interface from swipe_interface.py
-    from apps.swipe_interface import SwipeInterface
-    swipe_interface = SwipeInterface(st.session_state.ratings_manager)
+    swipe_interface = get_swipe_interface()
     swipe_interface.render_swipe_interface(
         st.session_state.swipe_recommendations,
         key="home_swipe"
@@ -797,36 +630,43 @@ def create_enhanced_swipe_page():
 
 def add_new_release_tracking(recommendations):
     """Add tracking for new releases that match user preferences"""
-    enhanced_recs = []
-    
-    for rec in recommendations:
-        # Check if it's a recent release (last 3 months)
-        try:
-            release_date = rec.get('release_date', '')
-            if release_date:
-                from datetime import datetime, timedelta
-                release_dt = datetime.strptime(release_date, '%Y-%m-%d')
-                three_months_ago = datetime.now() - timedelta(days=90)
-                
-                if release_dt > three_months_ago:
-                    rec['rec_reason'] = f"NEW RELEASE: {rec.get('rec_reason', 'Fresh content')}"
-                    rec['rec_score'] = rec.get('rec_score', 0.5) + 0.1  # Boost new releases
-                    
-        except:
-            pass  # Skip date parsing errors
-            
-        enhanced_recs.append(rec)
-    
-    return enhanced_recs
+    if not recommendations:
+        return recommendations
+
+    # Parse every release date in one pass; bad or missing dates become NaT
+    release_dates = pd.to_datetime(
+        [rec.get("release_date", "") for rec in recommendations],
+        format="%Y-%m-%d",
+        errors="coerce",
+    )
+    three_months_ago = pd.Timestamp.now() - pd.Timedelta(days=90)
 
+    for i in np.flatnonzero(release_dates > three_months_ago):
+        rec = recommendations[i]
+        rec['rec_reason'] = f"NEW RELEASE: {rec.get('rec_reason', 'Fresh content')}"
+        rec['rec_score'] = rec.get('rec_score', 0.5) + 0.1  # Boost new releases
 
+    return recommendations
+
+
+# Short rating labels used on the Your Swipes page
+_SWIPE_LABELS = {-1: "Not Interested", 0: "Watchlist", 1: "Hate", 2: "OK", 3: "Good", 4: "Perfect"}
+_SWIPE_RATINGS = tuple(_SWIPE_LABELS)
+_SWIPE_RATING_INDEX = {rating: i for i, rating in enumerate(_SWIPE_RATINGS)}
+_SWIPE_RATING_FILTERS = {
+    "Perfect (4)": 4, "Good (3)": 3, "OK (2)": 2, "Hate (1)": 1,
+    "Watchlist": 0, "Not Interested": -1
+}
+
+
+@st.fragment
 def show_your_swipes_page():
     """Clean interface for managing user ratings"""
     st.markdown("# Your Swipes")
     st.markdown("*Review and edit your ratings*")
     
     try:
-        ratings_df = st.session_state.ratings_manager.get_all_ratings()
+        ratings_df = get_ratings_df()
         
         if ratings_df.empty:
             st.info("No ratings yet! Go to Home to start swiping.")
@@ -856,29 +696,26 @@ def show_your_swipes_page():
         with col1:
             filter_type = st.selectbox("Filter by type", ["All", "Movies", "TV Shows"])
         with col2:
-            filter_rating = st.selectbox("Filter by rating", [
-                "All", "Perfect (4)", "Good (3)", "OK (2)", "Hate (1)", "Watchlist", "Not Interested"
-            ])
+            filter_rating = st.selectbox(
+                "Filter by rating", ["All", *_SWIPE_RATING_FILTERS]
+            )
         with col3:
             sort_by = st.selectbox("Sort by", [
                 "Date (Newest)", "Date (Oldest)", "Rating (High)", "Rating (Low)", "Title A-Z"
             ])
         
-        # Apply filters
-        filtered_df = ratings_df.copy()
-        
+        # Apply filters as one mask - boolean indexing already returns a new frame
+        mask = pd.Series(True, index=ratings_df.index)
         if filter_type == "Movies":
-            filtered_df = filtered_df[filtered_df["type"] == "movie"]
+            mask &= ratings_df["type"].eq("movie")
         elif filter_type == "TV Shows":
-            filtered_df = filtered_df[filtered_df["type"] == "tv"]
-            
+            mask &= ratings_df["type"].eq("tv")
+
         if filter_rating != "All":
-            rating_map = {
-                "Perfect (4)": 4, "Good (3)": 3, "OK (2)": 2, "Hate (1)": 1,
-                "Watchlist": 0, "Not Interested": -1
-            }
-            filtered_df = filtered_df[filtered_df["my_rating"] == rating_map[filter_rating]]
-        
+            mask &= ratings_df["my_rating"].eq(_SWIPE_RATING_FILTERS[filter_rating])
+
+        filtered_df = ratings_df.loc[mask]
+
         # Apply sorting
         if sort_by == "Date (Newest)":
             filtered_df = filtered_df.sort_values("date_rated", ascending=False)
@@ -890,11 +727,20 @@ def show_your_swipes_page():
             filtered_df = filtered_df.sort_values("my_rating", ascending=True)
         elif sort_by == "Title A-Z":
             filtered_df = filtered_df.sort_values("title", ascending=True)
-        
+
+        # Label every row in one vectorized pass
+        filtered_df = filtered_df.assign(
+            label=filtered_df["my_rating"].map(_SWIPE_LABELS).fillna("Unknown"),
+            # Widget keys are "<tmdb_id>_<type>"; build them for all rows at once
+            _key=filtered_df["tmdb_id"].astype(str) + "_" + filtered_df["type"].astype(str),
+        )
+
         # Display results
         st.markdown(f"### {len(filtered_df)} items")
         
-        for _, rating in filtered_df.iterrows():
+        for rating in filtered_df.to_dict("records"):
+            key = rating["_key"]
+            editing_key = f"editing_{key}"
             with st.container():
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
                 
@@ -905,51 +751,52 @@ def show_your_swipes_page():
                         st.caption(rating['overview'][:100] + "..." if len(rating['overview']) > 100 else rating['overview'])
                 
                 with col2:
-                    rating_labels = {-1: "Not Interested", 0: "Watchlist", 1: "Hate", 2: "OK", 3: "Good", 4: "Perfect"}
-                    current_label = rating_labels.get(rating["my_rating"], "Unknown")
-                    st.write(f"**{current_label}**")
-                    # Handle both string and timestamp objects
-                    date_str = str(rating["date_rated"])[:10] if rating.get("date_rated") else "Unknown"
+                    st.write(f"**{rating['label']}**")
+                    date_str = (
+                        rating["date_rated"].strftime("%Y-%m-%d")
+                        if pd.notna(rating["date_rated"])
+                        else "Unknown"
+                    )
                     st.caption(date_str)
                 
                 with col3:
-                    if st.button("Edit", key=f"edit_{rating['tmdb_id']}_{rating['type']}", use_container_width=True):
-                        st.session_state[f"editing_{rating['tmdb_id']}_{rating['type']}"] = True
+                    if st.button("Edit", key=f"edit_{key}", use_container_width=True):
+                        st.session_state[editing_key] = True
                 
                 with col4:
-                    if st.button("Delete", key=f"delete_{rating['tmdb_id']}_{rating['type']}", use_container_width=True):
+                    if st.button("Delete", key=f"delete_{key}", use_container_width=True):
                         success = st.session_state.ratings_manager.delete_rating(
                             rating["tmdb_id"], rating["type"]
                         )
                         if success:
-                            st.success("Deleted!")
+                            st.toast("Deleted!")
                             st.rerun()
                 
                 # Inline editing
-                if st.session_state.get(f"editing_{rating['tmdb_id']}_{rating['type']}", False):
+                if st.session_state.get(editing_key, False):
                     with st.expander("Edit Rating", expanded=True):
                         new_rating = st.selectbox(
                             "New rating:",
-                            options=[-1, 0, 1, 2, 3, 4],
-                            format_func=lambda x: rating_labels[x],
-                            index=[k for k, v in rating_labels.items()].index(rating["my_rating"]),
-                            key=f"new_rating_{rating['tmdb_id']}_{rating['type']}"
+                            options=_SWIPE_RATINGS,
+                            format_func=_SWIPE_LABELS.__getitem__,
+                            index=_SWIPE_RATING_INDEX[rating["my_rating"]],
+                            key=f"new_rating_{key}"
                         )
                         
                         col_save, col_cancel = st.columns(2)
                         with col_save:
-                            if st.button("Save", key=f"save_{rating['tmdb_id']}_{rating['type']}"):
+                            if st.button("Save", key=f"save_{key}"):
                                 success = st.session_state.ratings_manager.update_rating(
                                     rating["tmdb_id"], rating["type"], new_rating
                                 )
                                 if success:
-                                    st.success("Updated!")
-                                    del st.session_state[f"editing_{rating['tmdb_id']}_{rating['type']}"]
+                                    st.toast("Updated!")
+                                    del st.session_state[editing_key]
                                     st.rerun()
                         
                         with col_cancel:
-                            if st.button("Cancel", key=f"cancel_{rating['tmdb_id']}_{rating['type']}"):
-                                del st.session_state[f"editing_{rating['tmdb_id']}_{rating['type']}"]
+                            if st.button("Cancel", key=f"cancel_{key}"):
+                                del st.session_state[editing_key]
                                 st.rerun()
                 
                 st.markdown("---")
@@ -958,13 +805,14 @@ def show_your_swipes_page():
         st.error(f"Error loading your swipes: {e}")
 
 
+@st.fragment
 def show_watchlist_page():
     """Show user's watchlist with streaming platform info"""
     st.markdown("# Watchlist")
     st.markdown("*Your want-to-watch list with streaming info*")
     
     try:
-        ratings_df = st.session_state.ratings_manager.get_all_ratings()
+        ratings_df = get_ratings_df()
         watchlist = ratings_df[ratings_df["my_rating"] == 0]
         
         if watchlist.empty:
@@ -973,7 +821,8 @@ def show_watchlist_page():
         
         st.markdown(f"### {len(watchlist)} items in your watchlist")
         
-        for _, item in watchlist.iterrows():
+        for item in watchlist[["tmdb_id", "type", "title", "overview"]].to_dict("records"):
+            rid = f"{item['tmdb_id']}_{item['type']}"
             with st.container():
                 col1, col2 = st.columns([3, 1])
                 
@@ -984,12 +833,12 @@ def show_watchlist_page():
                         st.caption(item['overview'][:150] + "..." if len(item['overview']) > 150 else item['overview'])
                 
                 with col2:
-                    if st.button("Remove", key=f"remove_watchlist_{item['tmdb_id']}_{item['type']}"):
+                    if st.button("Remove", key=f"remove_watchlist_{rid}"):
                         success = st.session_state.ratings_manager.delete_rating(
                             item["tmdb_id"], item["type"]
                         )
                         if success:
-                            st.success("Removed from watchlist!")
+                            st.toast("Removed from watchlist!")
                             st.rerun()
                 
                 # TODO: Add streaming platform info here using TMDB watch providers API
@@ -1000,19 +849,45 @@ def show_watchlist_page():
         st.error(f"Error loading watchlist: {e}")
 
 
+def _next_recommendation_batch():
+    """Advance to a fresh batch; the button's own rerun then renders it"""
+    st.session_state.rec_cursor = st.session_state.get("rec_cursor", 0) + 1
+
+
+def _reset_recommendations():
+    """Forget served recommendations before the rerun draws a new batch"""
+    if "dynamic_rec_manager" in st.session_state:
+        st.session_state.dynamic_rec_manager.clear_used_items()
+    _next_recommendation_batch()
+
+
+def _recommendation_batch(count: int = 20):
+    """(recommendations, pool stats) for this session, redrawn only on a new
+    rating or Load More rather than on every rerun"""
+    key = (
+        st.session_state.ratings_manager.version,
+        st.session_state.get("rec_cursor", 0),
+    )
+    memo = st.session_state.get("_rec_batch")
+    if memo is None or memo[0] != key:
+        manager = st.session_state.dynamic_rec_manager
+        recommendations = manager.get_endless_recommendations(count)
+        memo = (key, recommendations, manager.get_pool_stats())
+        st.session_state._rec_batch = memo
+    return memo[1], memo[2]
+
+
+@st.fragment
 def show_recommendations_page():
     """Show endless personalized recommendations"""
     st.markdown("## 🎯 Your Endless Recommendations")
 
     try:
         # Initialize dynamic recommendation manager
-        if 'dynamic_rec_manager' not in st.session_state:
-            st.session_state.dynamic_rec_manager = DynamicRecommendationManager(
-                st.session_state.ratings_manager
-            )
+        _ensure_dynamic_rec_manager()
 
         # Get user's ratings to base recommendations on
-        user_ratings = st.session_state.ratings_manager.get_all_ratings()
+        user_ratings = get_ratings_df()
 
         # Show recommendations even for new users
         if user_ratings.empty:
@@ -1021,13 +896,12 @@ def show_recommendations_page():
             st.info(f"🎯 Based on your {len(user_ratings)} ratings - recommendations get smarter as you rate more!")
 
         # Get endless recommendations
-        recommendations = st.session_state.dynamic_rec_manager.get_endless_recommendations(20)
+        recommendations, pool_stats = _recommendation_batch(20)
 
         if recommendations:
             st.markdown(f"### 🌟 Fresh Recommendations ({len(recommendations)} loaded)")
             
             # Show pool stats
-            pool_stats = st.session_state.dynamic_rec_manager.get_pool_stats()
             with st.expander("📊 Recommendation Sources"):
                 col1, col2, col3 = st.columns(3)
                 with col1:
@@ -1040,29 +914,73 @@ def show_recommendations_page():
                     st.metric("🎯 Genre Deep Dive", pool_stats.get('genre_deep_dive', 0))
 
             for item in recommendations:
-                display_content_card(item)
+                _render_card(item)
                 st.markdown("---")
                 
-            # Load more button
-            if st.button("🔄 Load More Recommendations", use_container_width=True):
-                st.rerun()
+            # Load more button - the click already reruns, so just move the cursor
+            st.button(
+                "🔄 Load More Recommendations",
+                use_container_width=True,
+                on_click=_next_recommendation_batch,
+            )
         else:
             st.warning("No recommendations available. This shouldn't happen with the dynamic system!")
-            if st.button("🔄 Reset Recommendation System"):
-                if 'dynamic_rec_manager' in st.session_state:
-                    st.session_state.dynamic_rec_manager.clear_used_items()
-                st.rerun()
+            st.button("🔄 Reset Recommendation System", on_click=_reset_recommendations)
 
     except Exception as e:
         st.error(f"Error loading recommendations: {e}")
 
 
+def _counts_bar(rating_counts: tuple, colors: list, title: str, xaxis_title: str):
+    """Bar chart of (rating, count) pairs labelled with RATING_LABELS"""
+    import plotly.express as px
+
+    counts = pd.Series(dict(rating_counts))
+    values = counts.to_numpy()
+    fig = px.bar(
+        x=counts.index.map(RATING_LABELS).to_numpy(),
+        y=values,
+        color=values,
+        color_continuous_scale=colors,
+    )
+    fig.update_layout(
+        title=title,
+        xaxis_title=xaxis_title,
+        yaxis_title="Number of Items",
+        showlegend=False,
+    )
+    return fig
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _watched_ratings_fig(rating_counts: tuple):
+    """Bar chart of watched ratings, rebuilt only when the counts change"""
+    return _counts_bar(
+        rating_counts,
+        ["#FF4444", "#FFA500", "#32CD32", "#FFD700"],
+        "How You Rate Watched Content",
+        "Rating",
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _decisions_fig(decision_counts: tuple):
+    """Bar chart of watchlist and not-interested counts, cached like the above"""
+    return _counts_bar(
+        decision_counts,
+        ["#9CA3AF", "#6366F1"],
+        "Watchlist & Not Interested",
+        "Decision",
+    )
+
+
+@st.fragment
 def show_my_ratings_page():
     """Show user's ratings and statistics"""
     st.markdown("## 📊 Your Movie & TV Ratings")
 
     try:
-        ratings_df = st.session_state.ratings_manager.get_all_ratings()
+        ratings_df = get_ratings_df()
 
         if ratings_df.empty:
             st.info(
@@ -1070,47 +988,51 @@ def show_my_ratings_page():
             )
             return
 
-        # Filter out "want to see" and "don't want to see" for main stats
-        watched_ratings = ratings_df[ratings_df["my_rating"] > 0]
-
-        # Separate watchlist items
-        watchlist = ratings_df[ratings_df["my_rating"] == 0]
-        not_interested = ratings_df[ratings_df["my_rating"] == -1]
+        # One count per rating value feeds every stat and chart below;
+        # watched is 1-4, watchlist 0 and not interested -1
+        rating_counts = ratings_df["my_rating"].value_counts().sort_index()
+        watched_counts = rating_counts[rating_counts.index > 0]
+        watched_total = int(watched_counts.sum())
+        watchlist_total = int(rating_counts.get(0, 0))
+        not_interested_total = int(rating_counts.get(-1, 0))
 
-        if watched_ratings.empty and watchlist.empty and not_interested.empty:
+        if not (watched_total or watchlist_total or not_interested_total):
             st.info("You haven't rated any content yet!")
             return
 
-        # Statistics
+        type_counts = ratings_df.loc[ratings_df["my_rating"] > 0, "type"].value_counts()
+        movies_count = int(type_counts.get("movie", 0))
+        tv_count = int(type_counts.get("tv", 0))
+
         st.markdown("### 📈 Your Stats")
         col1, col2, col3, col4, col5 = st.columns(5)
 
         with col1:
             st.markdown('<div class="stats-card">', unsafe_allow_html=True)
-            st.metric("Watched", len(watched_ratings))
+            st.metric("Watched", watched_total)
             st.markdown("</div>", unsafe_allow_html=True)
 
         with col2:
             st.markdown('<div class="stats-card">', unsafe_allow_html=True)
-            st.metric("Want to See", len(watchlist))
+            st.metric("Want to See", watchlist_total)
             st.markdown("</div>", unsafe_allow_html=True)
 
         with col3:
             st.markdown('<div class="stats-card">', unsafe_allow_html=True)
-            movies_count = len(watched_ratings[watched_ratings["type"] == "movie"])
             st.metric("Movies", movies_count)
             st.markdown("</div>", unsafe_allow_html=True)
 
         with col4:
             st.markdown('<div class="stats-card">', unsafe_allow_html=True)
-            tv_count = len(watched_ratings[watched_ratings["type"] == "tv"])
             st.metric("TV Shows", tv_count)
             st.markdown("</div>", unsafe_allow_html=True)
 
         with col5:
             st.markdown('<div class="stats-card">', unsafe_allow_html=True)
-            if not watched_ratings.empty:
-                avg_rating = watched_ratings["my_rating"].mean()
+            if watched_total:
+                avg_rating = float(
+                    (watched_counts.index * watched_counts).sum() / watched_total
+                )
                 st.metric("Avg Rating", f"{avg_rating:.1f}/4")
             else:
                 st.metric("Avg Rating", "N/A")
@@ -1123,72 +1045,212 @@ def show_my_ratings_page():
         col1, col2 = st.columns(2)
 
         with col1:
-            if not watched_ratings.empty:
+            if watched_total:
                 st.markdown("**Watched Content:**")
-                rating_counts = watched_ratings["my_rating"].value_counts().sort_index()
-                fig = px.bar(
-                    x=[RATING_LABELS[i] for i in rating_counts.index],
-                    y=rating_counts.values,
-                    color=rating_counts.values,
-                    color_continuous_scale=["#FF4444", "#FFA500", "#32CD32", "#FFD700"],
-                )
-                fig.update_layout(
-                    title="How You Rate Watched Content",
-                    xaxis_title="Rating",
-                    yaxis_title="Number of Items",
-                    showlegend=False,
+                fig = _watched_ratings_fig(
+                    tuple(
+                        (int(rating), int(count))
+                        for rating, count in watched_counts.loc[1:4].items()
+                    )
                 )
                 st.plotly_chart(fig, use_container_width=True)
 
         with col2:
-            if not watchlist.empty or not not_interested.empty:
+            if watchlist_total or not_interested_total:
                 st.markdown("**Watchlist & Decisions:**")
-                other_counts = {}
-                if not watchlist.empty:
-                    other_counts[0] = len(watchlist)
-                if not not_interested.empty:
-                    other_counts[-1] = len(not_interested)
-
-                if other_counts:
-                    fig2 = px.bar(
-                        x=[RATING_LABELS[i] for i in other_counts.keys()],
-                        y=list(other_counts.values()),
-                        color=list(other_counts.values()),
-                        color_continuous_scale=["#9CA3AF", "#6366F1"],
-                    )
-                    fig2.update_layout(
-                        title="Watchlist & Not Interested",
-                        xaxis_title="Decision",
-                        yaxis_title="Number of Items",
-                        showlegend=False,
-                    )
-                    st.plotly_chart(fig2, use_container_width=True)
+                decision_counts = ((0, watchlist_total), (-1, not_interested_total))
+                fig2 = _decisions_fig(
+                    tuple((rating, count) for rating, count in decision_counts if count)
+                )
+                st.plotly_chart(fig2, use_container_width=True)
 
         # Recent activity
         st.markdown("### 🕒 Recent Activity")
-        recent_activity = ratings_df.sort_values("date_rated", ascending=False).head(15)
-
-        for _, rating in recent_activity.iterrows():
-            col1, col2, col3 = st.columns([3, 1, 1])
-            with col1:
-                content_type = "🎬" if rating["type"] == "movie" else "📺"
-                st.write(f"{content_type} **{rating['title']}**")
-            with col2:
-                st.write(RATING_LABELS[rating["my_rating"]])
-            with col3:
-                st.write(rating["date_rated"][:10])
+        # Partial top-15 select instead of sorting every rating
+        recent_activity = ratings_df.loc[ratings_df["date_rated"].nlargest(15).index]
+
+        # One table element instead of a row of columns per rating
+        st.dataframe(
+            pd.DataFrame(
+                {
+                    "": np.where(recent_activity["type"] == "movie", "🎬", "📺"),
+                    "Title": recent_activity["title"],
+                    "Rating": recent_activity["my_rating"].map(RATING_LABELS),
+                    "Rated": recent_activity["date_rated"].dt.strftime("%Y-%m-%d"),
+                }
+            ),
+            hide_index=True,
+            use_container_width=True,
+        )
 
     except Exception as e:
         st.error(f"Error loading ratings: {e}")
 
 
+# Edit Ratings filter/sort choices, keyed by the label shown in each selectbox
+_EDIT_TYPE_FILTERS = {"Movies": "movie", "TV Shows": "tv"}
+_EDIT_RATING_FILTERS = {
+    "Perfect (4)": 4,
+    "Good (3)": 3,
+    "OK (2)": 2,
+    "Hate (1)": 1,
+    "Not Interested": -1,
+}
+# label -> (column, ascending)
+_EDIT_SORTS = {
+    "Date Rated (Newest)": ("date_rated", False),
+    "Date Rated (Oldest)": ("date_rated", True),
+    "Title A-Z": ("title", True),
+    "Title Z-A": ("title", False),
+    "Rating (High-Low)": ("my_rating", False),
+    "Rating (Low-High)": ("my_rating", True),
+}
+
+# Edit Ratings per-row selector; None keeps the row's current rating
+_EDIT_RATING_OPTIONS = {
+    "Keep Current": None,
+    "😍 Perfect (4)": 4,
+    "👍 Good (3)": 3,
+    "😐 OK (2)": 2,
+    "👎 Hate (1)": 1,
+    "🚫 Not Interested": -1,
+}
+_EDIT_RATING_LABELS = tuple(_EDIT_RATING_OPTIONS)
+
+
+def _edit_row_details(rating: Dict) -> str:
+    """Build the markdown for an Edit Ratings row's details and overview"""
+    content_type = "🎬" if rating["type"] == "movie" else "📺"
+    parts = [f"### {content_type} {rating['title']}"]
+
+    if isinstance(rating["release_date"], str) and rating["release_date"]:
+        parts.append(f"**Year:** {rating['release_date'][:4]}")
+
+    if pd.notna(rating["tmdb_rating"]) and rating["tmdb_rating"]:
+        parts.append(f"**TMDB:** ⭐ {rating['tmdb_rating']:.1f}/10")
+
+    # Current rating
+    current_rating = rating["my_rating"]
+    if current_rating > 0:
+        rating_label = RATING_LABELS.get(current_rating, "Unknown")
+        parts.append(f"**Your Rating:** {rating_label} ({current_rating}/4)")
+    elif current_rating == -1:
+        parts.append("**Your Rating:** Not Interested")
+    else:
+        parts.append("**Your Rating:** Unknown")
+
+    if pd.notna(rating["date_rated"]):
+        parts.append(f"**Rated on:** {rating['date_rated'].strftime('%Y-%m-%d')}")
+
+    overview = rating["overview"]
+    if not isinstance(overview, str) or not overview:
+        overview = "No overview available"
+    elif len(overview) > 200:
+        overview = overview[:200] + "..."
+    parts.append(f"**Overview:** {overview}")
+
+    return "\n\n".join(parts)
+
+
+@st.fragment
+def _edit_rating_row(rating: Dict):
+    """One Edit Ratings row; picking a new rating reruns just this row"""
+    current_rating = rating["my_rating"]
+    rid = f"{rating['tmdb_id']}_{rating['type']}"
+    with st.container():
+        col_info, col_edit = st.columns([5, 2])
+
+        # Read-only details go out as one markdown element
+        col_info.markdown(_edit_row_details(rating))
+
+        with col_edit:
+            # Edit controls
+            st.markdown("**Edit Rating:**")
+
+            # New rating selector
+            new_rating_label = st.selectbox(
+                "New rating:",
+                _EDIT_RATING_LABELS,
+                index=0,
+                key=f"rating_select_{rid}",
+            )
+
+            new_rating = _EDIT_RATING_OPTIONS[new_rating_label]
+            if new_rating is None:
+                new_rating = current_rating
+
+            # Action buttons
+            col_update, col_delete = st.columns(2)
+
+            with col_update:
+                if st.button(
+                    "💾 Update",
+                    key=f"update_{rid}",
+                    use_container_width=True,
+                ):
+                    if new_rating != current_rating:
+                        try:
+                            success = (
+                                st.session_state.ratings_manager.update_rating(
+                                    rating["tmdb_id"],
+                                    rating["type"],
+                                    new_rating,
+                                )
+                            )
+                            if success:
+                                st.toast("✅ Rating updated!")
+                                # The list's order and contents change, so rerun the page
+                                st.rerun()
+                            else:
+                                st.error("❌ Failed to update rating")
+                        except Exception as e:
+                            st.error(f"❌ Error: {e}")
+                    else:
+                        st.info("No changes to save")
+
+            with col_delete:
+                if st.button(
+                    "🗑️ Delete",
+                    key=f"delete_{rid}",
+                    use_container_width=True,
+                ):
+                    try:
+                        success = (
+                            st.session_state.ratings_manager.delete_rating(
+                                rating["tmdb_id"], rating["type"]
+                            )
+                        )
+                        if success:
+                            st.toast("✅ Rating deleted!")
+                            st.rerun()
+                        else:
+                            st.error("❌ Failed to delete rating")
+                    except Exception as e:
+                        st.error(f"❌ Error: {e}")
+
+        st.markdown("---")
+
+
+def _sorted_slice(df, column: str, ascending: bool, start: int, stop: int):
+    """Rows start:stop of df ordered by column, selecting only what's needed"""
+    values = df[column]
+    # Partial selection drops missing values, so only use it on complete columns
+    if values.dtype != object and values.notna().all():
+        top = values.nsmallest(stop) if ascending else values.nlargest(stop)
+        return df.loc[top.index[start:]]
+    return df.sort_values(column, ascending=ascending, kind="mergesort").iloc[
+        start:stop
+    ]
+
+
+@st.fragment
 def show_edit_ratings_page():
     """Edit and manage all your ratings"""
     st.markdown("## ✏️ Edit Your Ratings")
     st.markdown("*View, edit, or delete your movie and TV show ratings*")
 
     try:
-        ratings_df = st.session_state.ratings_manager.get_all_ratings()
+        ratings_df = get_ratings_df()
 
         if ratings_df.empty:
             st.info(
@@ -1201,70 +1263,25 @@ def show_edit_ratings_page():
 
         with col1:
             content_filter = st.selectbox(
-                "Filter by type:", ["All", "Movies", "TV Shows"], index=0
+                "Filter by type:", ["All", *_EDIT_TYPE_FILTERS], index=0
             )
 
         with col2:
             rating_filter = st.selectbox(
-                "Filter by rating:",
-                [
-                    "All Ratings",
-                    "Perfect (4)",
-                    "Good (3)",
-                    "OK (2)",
-                    "Hate (1)",
-                    "Not Interested",
-                ],
-                index=0,
+                "Filter by rating:", ["All Ratings", *_EDIT_RATING_FILTERS], index=0
             )
 
         with col3:
-            sort_by = st.selectbox(
-                "Sort by:",
-                [
-                    "Date Rated (Newest)",
-                    "Date Rated (Oldest)",
-                    "Title A-Z",
-                    "Title Z-A",
-                    "Rating (High-Low)",
-                    "Rating (Low-High)",
-                ],
-                index=0,
-            )
+            sort_by = st.selectbox("Sort by:", list(_EDIT_SORTS), index=0)
 
-        # Apply filters
-        filtered_df = ratings_df.copy()
-
-        if content_filter == "Movies":
-            filtered_df = filtered_df[filtered_df["type"] == "movie"]
-        elif content_filter == "TV Shows":
-            filtered_df = filtered_df[filtered_df["type"] == "tv"]
-
-        if rating_filter != "All Ratings":
-            if rating_filter == "Perfect (4)":
-                filtered_df = filtered_df[filtered_df["my_rating"] == 4]
-            elif rating_filter == "Good (3)":
-                filtered_df = filtered_df[filtered_df["my_rating"] == 3]
-            elif rating_filter == "OK (2)":
-                filtered_df = filtered_df[filtered_df["my_rating"] == 2]
-            elif rating_filter == "Hate (1)":
-                filtered_df = filtered_df[filtered_df["my_rating"] == 1]
-            elif rating_filter == "Not Interested":
-                filtered_df = filtered_df[filtered_df["my_rating"] == -1]
+        # Apply filters as one mask so only the final selection is copied
+        mask = pd.Series(True, index=ratings_df.index)
+        if content_filter in _EDIT_TYPE_FILTERS:
+            mask &= ratings_df["type"].eq(_EDIT_TYPE_FILTERS[content_filter])
+        if rating_filter in _EDIT_RATING_FILTERS:
+            mask &= ratings_df["my_rating"].eq(_EDIT_RATING_FILTERS[rating_filter])
 
-        # Apply sorting
-        if sort_by == "Date Rated (Newest)":
-            filtered_df = filtered_df.sort_values("date_rated", ascending=False)
-        elif sort_by == "Date Rated (Oldest)":
-            filtered_df = filtered_df.sort_values("date_rated", ascending=True)
-        elif sort_by == "Title A-Z":
-            filtered_df = filtered_df.sort_values("title", ascending=True)
-        elif sort_by == "Title Z-A":
-            filtered_df = filtered_df.sort_values("title", ascending=False)
-        elif sort_by == "Rating (High-Low)":
-            filtered_df = filtered_df.sort_values("my_rating", ascending=False)
-        elif sort_by == "Rating (Low-High)":
-            filtered_df = filtered_df.sort_values("my_rating", ascending=True)
+        filtered_df = ratings_df.loc[mask]
 
         # Display results
         if filtered_df.empty:
@@ -1277,151 +1294,47 @@ def show_edit_ratings_page():
         items_per_page = 10
         total_pages = (len(filtered_df) - 1) // items_per_page + 1
 
+        page = 1
         if total_pages > 1:
             page = st.selectbox(
                 f"Page (1-{total_pages}):", range(1, total_pages + 1), index=0
             )
-            start_idx = (page - 1) * items_per_page
-            end_idx = start_idx + items_per_page
-            page_df = filtered_df.iloc[start_idx:end_idx]
-        else:
-            page_df = filtered_df
-
-        # Display each rating with edit options
-        for idx, (_, rating) in enumerate(page_df.iterrows()):
-            with st.container():
-                st.markdown('<div class="movie-card">', unsafe_allow_html=True)
-
-                col1, col2, col3 = st.columns([2, 3, 2])
-
-                with col1:
-                    # Basic info
-                    content_type = "🎬" if rating["type"] == "movie" else "📺"
-                    st.markdown(f"### {content_type} {rating['title']}")
-
-                    if rating.get("release_date"):
-                        year = (
-                            rating["release_date"][:4]
-                            if rating["release_date"]
-                            else "N/A"
-                        )
-                        st.markdown(f"**Year:** {year}")
-
-                    if rating.get("tmdb_rating"):
-                        st.markdown(f"**TMDB:** ⭐ {rating['tmdb_rating']:.1f}/10")
-
-                    # Current rating
-                    current_rating = rating["my_rating"]
-                    if current_rating > 0:
-                        rating_label = RATING_LABELS.get(current_rating, "Unknown")
-                        st.markdown(
-                            f"**Your Rating:** {rating_label} ({current_rating}/4)"
-                        )
-                    elif current_rating == -1:
-                        st.markdown("**Your Rating:** Not Interested")
-                    else:
-                        st.markdown("**Your Rating:** Unknown")
-
-                    date_rated = rating.get("date_rated", "")
-                    if date_rated:
-                        st.markdown(f"**Rated on:** {date_rated[:10]}")
-
-                with col2:
-                    # Overview
-                    overview = rating.get("overview", "No overview available")
-                    if len(overview) > 200:
-                        overview = overview[:200] + "..."
-                    st.markdown(f"**Overview:** {overview}")
-
-                with col3:
-                    # Edit controls
-                    st.markdown("**Edit Rating:**")
-
-                    # New rating selector
-                    rating_options = {
-                        "Keep Current": current_rating,
-                        "😍 Perfect (4)": 4,
-                        "👍 Good (3)": 3,
-                        "😐 OK (2)": 2,
-                        "👎 Hate (1)": 1,
-                        "🚫 Not Interested": -1,
-                    }
-
-                    new_rating_label = st.selectbox(
-                        "New rating:",
-                        list(rating_options.keys()),
-                        index=0,
-                        key=f"rating_select_{rating['tmdb_id']}_{rating['type']}",
-                    )
+        start_idx = (page - 1) * items_per_page
 
-                    new_rating = rating_options[new_rating_label]
-
-                    # Action buttons
-                    col_update, col_delete = st.columns(2)
-
-                    with col_update:
-                        if st.button(
-                            "💾 Update",
-                            key=f"update_{rating['tmdb_id']}_{rating['type']}",
-                            use_container_width=True,
-                        ):
-                            if new_rating != current_rating:
-                                try:
-                                    success = (
-                                        st.session_state.ratings_manager.update_rating(
-                                            rating["tmdb_id"],
-                                            rating["type"],
-                                            new_rating,
-                                        )
-                                    )
-                                    if success:
-                                        st.success("✅ Rating updated!")
-                                        time.sleep(1)
-                                        st.rerun()
-                                    else:
-                                        st.error("❌ Failed to update rating")
-                                except Exception as e:
-                                    st.error(f"❌ Error: {e}")
-                            else:
-                                st.info("No changes to save")
-
-                    with col_delete:
-                        if st.button(
-                            "🗑️ Delete",
-                            key=f"delete_{rating['tmdb_id']}_{rating['type']}",
-                            use_container_width=True,
-                        ):
-                            try:
-                                success = (
-                                    st.session_state.ratings_manager.delete_rating(
-                                        rating["tmdb_id"], rating["type"]
-                                    )
-                                )
-                                if success:
-                                    st.success("✅ Rating deleted!")
-                                    time.sleep(1)
-                                    st.rerun()
-                                else:
-                                    st.error("❌ Failed to delete rating")
-                            except Exception as e:
-                                st.error(f"❌ Error: {e}")
+        # Order only as far as the current page instead of sorting everything
+        sort_column, ascending = _EDIT_SORTS[sort_by]
+        page_df = _sorted_slice(
+            filtered_df, sort_column, ascending, start_idx, start_idx + items_per_page
+        )
 
-                st.markdown("</div>", unsafe_allow_html=True)
-                st.markdown("---")
+        # Display each rating with edit options; plain dicts of just the
+        # columns the rows read avoid building a Series per row
+        for rating in page_df[
+            [
+                "tmdb_id",
+                "type",
+                "title",
+                "release_date",
+                "tmdb_rating",
+                "my_rating",
+                "date_rated",
+                "overview",
+            ]
+        ].to_dict("records"):
+            _edit_rating_row(rating)
 
         # Bulk actions
         st.markdown("### 🔧 Bulk Actions")
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            if st.button("📤 Export All Ratings", use_container_width=True):
-                csv_data = ratings_df.to_csv(index=False)
-                st.download_button(
-                    label="💾 Download CSV",
-                    data=csv_data,
-                    file_name=f"filmy_ratings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                )
+            st.download_button(
+                label="📤 Export All Ratings",
+                data=_ratings_csv(st.session_state.ratings_manager.version),
+                file_name=f"filmy_ratings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv",
+                use_container_width=True,
+            )
 
         with col2:
             if st.button("🔄 Sync to Google Sheets", use_container_width=True):
@@ -1453,16 +1366,11 @@ def main():
     """Main application - Cache Bust v2025.06.21.16.51"""
 
     # Initialize session state at the start of main
-    if "tmdb" not in st.session_state:
-        try:
-            st.session_state.tmdb = TMDBApi()
-        except Exception as e:
-            st.error(f"Failed to initialize TMDB API: {e}")
-            return
-
+    # The manager is a process-wide singleton; session_state just holds a
+    # reference. The TMDB client is only created when a page first needs it
     if "ratings_manager" not in st.session_state:
         try:
-            st.session_state.ratings_manager = EnhancedRatingsManager()
+            st.session_state.ratings_manager = get_ratings_manager()
         except Exception as e:
             st.error(f"Failed to initialize ratings manager: {e}")
             return
@@ -1502,20 +1410,19 @@ def main():
         # Sidebar stats
         st.markdown("---")
         try:
-            ratings_df = st.session_state.ratings_manager.get_all_ratings()
-            if not ratings_df.empty:
-                total_items = len(ratings_df)
-                positive_ratings = ratings_df[ratings_df["my_rating"] > 0]
-                watchlist = len(ratings_df[ratings_df["my_rating"] == 0])
-                
+            total_items, watched, watchlist = _sidebar_stats(
+                st.session_state.ratings_manager.version
+            )
+            if total_items:
                 st.markdown("### Quick Stats")
                 st.metric("Total Items", total_items)
-                st.metric("Watched", len(positive_ratings))
+                st.metric("Watched", watched)
                 st.metric("Watchlist", watchlist)
         except Exception:
             pass
 
-    # Main content
+    # Main content - the list pages are fragments, so their own filters,
+    # pagers and buttons rerun just the page rather than the whole app
     if selected == "Home":
         show_home_page()
     elif selected == "Recommendations":
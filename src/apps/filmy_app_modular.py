@@ -3,16 +3,20 @@ FILMY - Modular Main Application
 Clean, organized structure using separated components and pages
 """
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 from streamlit_option_menu import option_menu
 
-# Import core modules
-from core.enhanced_ratings_manager import EnhancedRatingsManager
-from core.dynamic_recommendations import DynamicRecommendationManager
+# RapidFuzz is optional - search falls back to substring matches only
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    process = None
 
 # Import modular components
-from components.cards import load_css
-from utils.helpers import initialize_session_state
+from components.cards import RATING_CSS_CLASSES, load_css
+from utils.helpers import initialize_session_state, load_ratings
 
 
 # Page configuration
@@ -27,6 +31,8 @@ st.set_page_config(
 @st.cache_resource
 def get_ratings_manager():
     """Cached ratings manager initialization"""
+    from core.enhanced_ratings_manager import EnhancedRatingsManager
+
     return EnhancedRatingsManager()
 
 
@@ -42,12 +48,62 @@ def initialize_app():
     # Initialize ratings manager (cached)
     if 'ratings_manager' not in st.session_state:
         st.session_state.ratings_manager = get_ratings_manager()
-    
-    # Initialize dynamic recommendations manager
+
+
+def get_recommendation_manager():
+    """Dynamic recommendations manager, imported and built on first use"""
     if 'dynamic_recommendations' not in st.session_state:
+        from core.dynamic_recommendations import DynamicRecommendationManager
+
         st.session_state.dynamic_recommendations = DynamicRecommendationManager(
             st.session_state.ratings_manager
         )
+    return st.session_state.dynamic_recommendations
+
+
+# Cards rendered first; the rest of a page follows in the same run
+_ABOVE_FOLD = 3
+
+
+def render_progressively(items, render_item) -> None:
+    """Render the first few items, then the remainder into a container after them"""
+    for item in items[:_ABOVE_FOLD]:
+        render_item(item)
+
+    # Streamlit sends each element as it is produced, so the first cards are
+    # on screen while these are still being built
+    rest = items[_ABOVE_FOLD:]
+    if rest:
+        with st.container():
+            for item in rest:
+                render_item(item)
+
+
+# Recommendations drawn up front, and per "Load more" click
+_FIRST_RECS = 3
+_MORE_RECS = 7
+
+
+def get_recommendations_batch():
+    """This session's drawn recommendations, kept until the ratings change"""
+    version = st.session_state.ratings_manager.version
+    memo = st.session_state.get('_recs')
+    if memo is None or memo[0] != version:
+        recs = get_recommendation_manager().get_endless_recommendations(
+            count=_FIRST_RECS
+        )
+        memo = (version, recs)
+        st.session_state._recs = memo
+    return memo[1]
+
+
+def load_more_recommendations():
+    """Append the next batch to the drawn recommendations"""
+    get_recommendations_batch().extend(
+        get_recommendation_manager().get_endless_recommendations(
+            count=_MORE_RECS
+        )
+    )
 
 
 def show_recommendations_page():
@@ -62,10 +118,8 @@ def show_recommendations_page():
     )
     
     try:
-        # Get dynamic recommendations
-        recs = st.session_state.dynamic_recommendations.get_endless_recommendations(
-            count=10
-        )
+        # A small first batch renders fast; more are drawn only on request
+        recs = get_recommendations_batch()
         
         if not recs:
             st.info("🎬 Start rating movies to get personalized recommendations!")
@@ -81,12 +135,93 @@ def show_recommendations_page():
                 show_rec_reason=True,
                 card_key=f"rec_{i}"
             )
+        
+        st.button("🔄 Load more", on_click=load_more_recommendations)
             
     except Exception as e:
         st.error(f"Error loading recommendations: {e}")
         st.info("Please try refreshing the page.")
 
 
+# The only rating columns the Your Swipes page reads
+_SWIPE_COLUMNS = [
+    'title', 'my_rating', 'my_rating_label', 'release_date', 'date_rated', 'tmdb_id', 'type'
+]
+
+
+def _text_prefix(col: pd.Series, n: int) -> pd.Series:
+    """First n characters of each string, 'N/A' for blanks and non-strings"""
+    prefix = col.where(col.map(type) == str, '').str[:n]
+    return prefix.mask(prefix == '', 'N/A')
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _ratings_slim(version: int):
+    """Ratings narrowed to the Your Swipes columns, once per ratings version"""
+    df = load_ratings(version)[_SWIPE_COLUMNS].copy()
+    # Small fixed domains - store as int8 codes instead of objects/int64; the
+    # nullable Int8 keeps blank ratings as <NA> rather than 0 (= Watchlist)
+    df['my_rating'] = pd.to_numeric(df['my_rating'], errors='coerce').astype('Int8')
+    df['my_rating_label'] = df['my_rating_label'].astype('category')
+    df['type'] = df['type'].astype('category')
+    # Display fields derived column-wise so a card render is a plain template fill
+    df['css_class'] = (
+        (df['my_rating'] + 2).map(dict(enumerate(RATING_CSS_CLASSES))).fillna('')
+    )
+    df['release_year'] = _text_prefix(df.pop('release_date'), 4)
+    df['date_formatted'] = _text_prefix(df['date_rated'], 10)
+    return df
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _sorted_ratings(version: int):
+    """Ratings newest first, sorted once per ratings version"""
+    df = _ratings_slim(version).sort_values('date_rated', ascending=False)
+    # Lowercase titles once so searches don't case-fold every row per keystroke
+    return df.assign(title_lower=df['title'].astype(str).str.lower())
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _search_ratings(version: int, search_term: str):
+    """Positions in the sorted ratings whose title contains search_term, memoized per query"""
+    df = _sorted_ratings(version)
+    query = search_term.lower()
+    # Plain substring match in one pass over the titles - no regex, no pandas mask
+    titles = df['title_lower'].to_numpy()
+    matches = np.fromiter(
+        (query in title for title in titles), dtype=bool, count=len(titles)
+    ).nonzero()[0]
+
+    # Near-miss typos ("avatr") fall back to the closest fuzzy title
+    if not len(matches) and process is not None and len(query) >= 3:
+        best = process.extractOne(
+            query, df['title_lower'].unique(), scorer=fuzz.WRatio, score_cutoff=75
+        )
+        if best:
+            matches = (df['title_lower'] == best[0]).to_numpy().nonzero()[0]
+
+    return matches
+
+
+def delete_selected_ratings():
+    """Delete every checked Your Swipes rating in one manager call"""
+    selected = [
+        key for key, checked in st.session_state.items()
+        if key.startswith('swipe_sel_') and checked
+    ]
+    items = [key.split('_', 3)[2:] for key in selected]
+    deleted = st.session_state.ratings_manager.delete_ratings(items)
+    for key in selected:
+        del st.session_state[key]
+    st.toast(f"🗑️ Deleted {deleted} rating{'s' if deleted != 1 else ''}")
+
+
+def step_swipes_page(delta: int, total_pages: int):
+    """Move the Your Swipes page by delta, kept within 1..total_pages"""
+    page = st.session_state.swipes_page + delta
+    st.session_state.swipes_page = min(max(page, 1), total_pages)
+
+
 def show_your_swipes_page():
     """Your swipes/ratings page with pagination and search"""
     st.markdown(
@@ -98,111 +233,115 @@ def show_your_swipes_page():
         unsafe_allow_html=True
     )
     
+    show_swipes_list()
+
+
+@st.fragment
+def show_swipes_list():
+    """Search, paging and rating cards - reruns alone on their own widgets"""
     try:
-        ratings_df = st.session_state.ratings_manager.get_all_ratings()
+        version = st.session_state.ratings_manager.version
+        sorted_ratings = _sorted_ratings(version)
         
-        if ratings_df.empty:
+        if sorted_ratings.empty:
             st.info("🎬 No ratings yet! Start swiping to build your profile.")
             return
         
         # Add search functionality
         search_term = st.text_input("🔍 Search your ratings", placeholder="Movie or TV show title...")
         
-        # Filter by search term
-        if search_term:
-            mask = ratings_df['title'].str.contains(search_term, case=False, na=False)
-            filtered_df = ratings_df[mask]
-        else:
-            filtered_df = ratings_df
-        
-        # Sort by date
-        recent_ratings = filtered_df.sort_values('date_rated', ascending=False)
+        # A search is a cached array of row positions into the date-sorted frame
+        positions = _search_ratings(version, search_term) if search_term else None
+        total_items = len(sorted_ratings) if positions is None else len(positions)
         
         # Pagination
         items_per_page = 10
-        total_pages = (len(recent_ratings) + items_per_page - 1) // items_per_page
+        total_pages = (total_items + items_per_page - 1) // items_per_page
         
-        if 'swipes_page' not in st.session_state:
-            st.session_state.swipes_page = 1
+        st.session_state.setdefault('swipes_page', 1)
         
         # Page controls
         if total_pages > 1:
             col1, col2, col3 = st.columns([1, 2, 1])
             with col1:
-                if st.button("◀ Previous") and st.session_state.swipes_page > 1:
-                    st.session_state.swipes_page -= 1
-                    st.rerun()
+                st.button("◀ Previous", on_click=step_swipes_page, args=(-1, total_pages))
             with col2:
                 st.markdown(
                     f"<div style='text-align: center;'>Page {st.session_state.swipes_page} of {total_pages}</div>",
                     unsafe_allow_html=True
                 )
             with col3:
-                if st.button("Next ▶") and st.session_state.swipes_page < total_pages:
-                    st.session_state.swipes_page += 1
-                    st.rerun()
+                st.button("Next ▶", on_click=step_swipes_page, args=(1, total_pages))
+        
+        st.button("🗑️ Delete selected", on_click=delete_selected_ratings)
         
         # Show current page items
         start_idx = (st.session_state.swipes_page - 1) * items_per_page
         end_idx = start_idx + items_per_page
-        page_ratings = recent_ratings.iloc[start_idx:end_idx]
+        # Only the visible page's rows are ever taken out of the cached frame
+        if positions is None:
+            page_ratings = sorted_ratings.iloc[start_idx:end_idx]
+        else:
+            page_ratings = sorted_ratings.iloc[positions[start_idx:end_idx]]
         
-        # Display ratings
-        for idx, row in page_ratings.iterrows():
-            display_rating_item(row, idx)
+        # Display ratings - namedtuples avoid boxing each row into a Series
+        render_progressively(
+            list(page_ratings.itertuples(index=False, name='R')),
+            display_rating_item,
+        )
             
     except Exception as e:
         st.error(f"Error loading ratings: {e}")
 
 
-def display_rating_item(row, idx):
+# Rating card markup, filled from the precomputed Your Swipes columns
+_CARD_TMPL = """
+<div class="movie-card {css_class}">
+    <strong>{title}</strong> ({release_year})<br>
+    <small>{my_rating_label} • {date_formatted}</small>
+</div>
+"""
+
+
+def display_rating_item(row):
     """Display individual rating item with actions"""
+    # Keyed on the title, not the frame position, so widgets survive search and paging
+    item_key = f"{int(row.tmdb_id)}_{row.type}"
     with st.container():
         col1, col2, col3 = st.columns([3, 1, 1])
         
         with col1:
-            rating_class = get_rating_class(row['my_rating'])
-            release_year = row.get('release_date', 'N/A')[:4] if row.get('release_date') else 'N/A'
-            date_formatted = row.get('date_rated', '')[:10] if row.get('date_rated') else 'N/A'
-            
-            st.markdown(
-                f"""
-                <div class="movie-card {rating_class}">
-                    <strong>{row['title']}</strong> ({release_year})<br>
-                    <small>{row['my_rating_label']} • {date_formatted}</small>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+            st.markdown(_CARD_TMPL.format_map(row._asdict()), unsafe_allow_html=True)
         
         with col2:
-            if st.button("✏️ Edit", key=f"edit_{idx}"):
-                st.session_state[f'editing_{row["tmdb_id"]}'] = True
+            if st.button("✏️ Edit", key=f"edit_{item_key}"):
+                st.session_state[f'editing_{item_key}'] = True
         
         with col3:
-            if st.button("🗑️ Delete", key=f"delete_{idx}"):
-                success = st.session_state.ratings_manager.delete_rating(
-                    row['tmdb_id'], row['type']
-                )
-                if success:
-                    st.success("Deleted!")
-                    st.rerun()
-                else:
-                    st.error("Failed to delete")
-
-
-def get_rating_class(rating):
-    """Get CSS class for rating - optimized lookup"""
-    rating_classes = {
-        4: "loved-it",
-        3: "liked-it", 
-        2: "it-was-ok",
-        1: "didnt-like-it",
-        0: "want-to-see",
-        -1: "not-interested",
-        -2: "watchlist-item"
-    }
-    return rating_classes.get(rating, "")
+            st.checkbox("🗑️ Select", key=f"swipe_sel_{item_key}")
+
+
+# Sidebar menu styling, using the CSS variables from styles.css
+_MENU_STYLES = {
+    "container": {
+        "padding": "0!important", 
+        "background-color": "var(--soft-bg, #fafafa)"
+    },
+    "icon": {
+        "color": "var(--primary, #FF6B6B)", 
+        "font-size": "18px"
+    }, 
+    "nav-link": {
+        "font-size": "16px", 
+        "text-align": "left", 
+        "margin": "0px", 
+        "--hover-color": "#eee",
+        "color": "var(--text-primary, #333333)"
+    },
+    "nav-link-selected": {
+        "background-color": "var(--primary, #FF6B6B)"
+    },
+}
 
 
 def main():
@@ -220,26 +359,7 @@ def main():
                 icons=["house", "stars", "heart"],
                 menu_icon="film",
                 default_index=0,
-                styles={
-                    "container": {
-                        "padding": "0!important", 
-                        "background-color": "var(--soft-bg, #fafafa)"
-                    },
-                    "icon": {
-                        "color": "var(--primary, #FF6B6B)", 
-                        "font-size": "18px"
-                    }, 
-                    "nav-link": {
-                        "font-size": "16px", 
-                        "text-align": "left", 
-                        "margin": "0px", 
-                        "--hover-color": "#eee",
-                        "color": "var(--text-primary, #333333)"
-                    },
-                    "nav-link-selected": {
-                        "background-color": "var(--primary, #FF6B6B)"
-                    },
-                }
+                styles=_MENU_STYLES,
             )
         
         # Route to selected page with lazy imports
@@ -1,109 +1,17 @@
+import json
+import jinja2
 import streamlit as st
 import streamlit.components.v1 as components
 from typing import Dict, List
 
 # Import our core modules
 from core.config import TMDB_IMAGE_BASE_URL
-from core.tmdb_api import TMDBApi
+from core.tmdb_api import get_tmdb_api
 from core.enhanced_ratings_manager import EnhancedRatingsManager
 
 
-class SwipeInterface:
-    """
-    Mobile-first swipe interface for rating movies.
-    Tinder-style swipe gestures with intelligent rating logic.
-    """
-    
-    def __init__(self, ratings_manager: EnhancedRatingsManager):
-        self.ratings_manager = ratings_manager
-        self.tmdb = TMDBApi()
-        
-    def create_swipe_card_html(self, item: Dict, card_id: str) -> str:
-        """Generate HTML for a swipeable movie card"""
-        poster_url = f"{TMDB_IMAGE_BASE_URL}{item['poster_path']}" if item.get('poster_path') else ""
-        
-        # Calculate recommendation info
-        rec_reason = item.get('rec_reason', '')
-        match_score = int(item.get('final_score', 0.5) * 100)
-        
-        genres = ", ".join(item.get('genres', [])) if isinstance(item.get('genres'), list) else str(item.get('genres', ''))
-        
-        html = f"""
-        <div id="card-{card_id}" class="swipe-card" data-movie-id="{item['id']}" data-movie-type="{item['type']}">
-            <div class="card-content">
-                <div class="poster-section">
-                    {f'<img src="{poster_url}" class="poster-img" alt="Poster" onerror="this.style.display=\'none\'">' if poster_url else ''}
-                    <div class="poster-fallback">🎬</div>
-                </div>
-                
-                <div class="info-section">
-                    <h2 class="movie-title">{item['title']}</h2>
-                    
-                    <div class="movie-meta">
-                        <span class="year">📅 {item.get('release_date', 'N/A')[:4]}</span>
-                        <span class="rating">⭐ {item.get('vote_average', 0):.1f}/10</span>
-                        <span class="type">{'🎬 Movie' if item['type'] == 'movie' else '📺 TV'}</span>
-                    </div>
-                    
-                    {f'<div class="rec-reason">🎯 {rec_reason} ({match_score}% match)</div>' if rec_reason else ''}
-                    
-                    <div class="genres">{genres}</div>
-                    
-                    <div class="overview">{item.get('overview', 'No description available')[:200]}...</div>
-                </div>
-            </div>
-            
-            <div class="action-buttons">
-                <button class="btn btn-havent-seen" onclick="handleHaventSeen('{card_id}')">
-                    🤷 Haven't Seen
-                </button>
-                <button class="btn btn-have-seen" onclick="handleHaveSeen('{card_id}')">
-                    👀 Have Seen
-                </button>
-            </div>
-            
-            <!-- Mobile-friendly extended actions -->
-            <div class="extended-actions">
-                <button class="btn btn-watchlist" onclick="handleWatchlist('{card_id}')">
-                    📋 Watchlist
-                </button>
-                <button class="btn btn-skip" onclick="handleSkip('{card_id}')">
-                    ⏭️ Skip
-                </button>
-            </div>
-            
-            <div class="rating-mode" id="rating-mode-{card_id}" style="display: none;">
-                <div class="rating-instruction">
-                    <p>👈 Swipe left: Didn't like it</p>
-                    <p>👉 Swipe right: Liked it</p>
-                </div>
-                <div class="quick-rate-buttons">
-                    <button class="btn btn-hate" onclick="quickRate('{card_id}', 1)">😤 Hate</button>
-                    <button class="btn btn-ok" onclick="quickRate('{card_id}', 2)">🤷 OK</button>
-                    <button class="btn btn-good" onclick="quickRate('{card_id}', 3)">👍 Good</button>
-                    <button class="btn btn-perfect" onclick="quickRate('{card_id}', 4)">🌟 Perfect</button>
-                </div>
-            </div>
-            
-            <!-- Swipe indicators -->
-            <div class="swipe-indicator left-indicator" id="left-indicator-{card_id}">
-                <div class="indicator-content">
-                    <span class="indicator-text" id="left-text-{card_id}">❌</span>
-                </div>
-            </div>
-            <div class="swipe-indicator right-indicator" id="right-indicator-{card_id}">
-                <div class="indicator-content">
-                    <span class="indicator-text" id="right-text-{card_id}">✅</span>
-                </div>
-            </div>
-        </div>
-        """
-        
-        return html
-    
-    def get_swipe_css(self) -> str:
-        """CSS for the swipe interface"""
-        return """
+# Stylesheet and script shared by every swipe card, built once at import
+_SWIPE_CSS = """
         <style>
         .swipe-container {
             position: relative;
@@ -127,6 +35,20 @@ class SwipeInterface:
             transform-origin: center bottom;
             transition: transform 0.3s ease;
             z-index: 10;
+            /* Own compositor layer so drag transforms don't repaint the card */
+            will-change: transform;
+            contain: layout paint;
+            backface-visibility: hidden;
+        }
+        
+        /* Follow the pointer directly while dragging instead of easing */
+        .swipe-card.dragging {
+            transition: none;
+        }
+        
+        /* The first card in the deck sits on top of the ones behind it */
+        .swipe-card ~ .swipe-card {
+            z-index: 9;
         }
         
         .swipe-card:active {
@@ -152,6 +74,7 @@ class SwipeInterface:
             width: 100%;
             height: 100%;
             object-fit: cover;
+            contain: strict;
         }
         
         .poster-fallback {
@@ -496,10 +419,8 @@ class SwipeInterface:
         }
         </style>
         """
-    
-    def get_swipe_javascript(self) -> str:
-        """JavaScript for swipe functionality"""
-        return """
+
+_SWIPE_JS = """
         <script>
         let currentCard = null;
         let cardMode = 'default'; // 'default' or 'rating'
@@ -509,20 +430,31 @@ class SwipeInterface:
         let currentY = 0;
         let cardInitialTransform = '';
         let keyboardActive = false;
+        let rafPending = false;
+        
+        // Pre-rendered cards waiting behind the visible stack
+        const upcomingCards = JSON.parse(
+            (document.getElementById('deck-data') || {}).textContent || '[]'
+        );
+        
+        let swipeInitialized = false;
         
         function initializeSwipe() {
-            const cards = document.querySelectorAll('.swipe-card');
-            cards.forEach(card => {
-                card.addEventListener('touchstart', handleTouchStart, {passive: false});
-                card.addEventListener('touchmove', handleTouchMove, {passive: false});
-                card.addEventListener('touchend', handleTouchEnd, {passive: false});
-                
-                // Mouse events for desktop testing
-                card.addEventListener('mousedown', handleMouseDown);
-                card.addEventListener('mousemove', handleMouseMove);
-                card.addEventListener('mouseup', handleMouseEnd);
-                card.addEventListener('mouseleave', handleMouseEnd);
-            });
+            if (swipeInitialized) return;
+            swipeInitialized = true;
+            
+            // One delegated set of listeners covers every card, including
+            // cards appended later; handlers find their card via closest()
+            const container = document.querySelector('.swipe-container');
+            container.addEventListener('touchstart', handleTouchStart, {passive: false});
+            container.addEventListener('touchmove', handleTouchMove, {passive: false});
+            container.addEventListener('touchend', handleTouchEnd, {passive: false});
+            
+            // Mouse events for desktop testing
+            container.addEventListener('mousedown', handleMouseDown);
+            container.addEventListener('mousemove', handleMouseMove);
+            container.addEventListener('mouseup', handleMouseEnd);
+            container.addEventListener('mouseleave', handleMouseEnd);
             
             // Add keyboard event listeners
             document.addEventListener('keydown', handleKeyDown);
@@ -697,21 +629,25 @@ class SwipeInterface:
         function handleTouchStart(e) {
             if (keyboardActive) return;
             currentCard = e.target.closest('.swipe-card');
+            if (!currentCard) return;
             startX = e.touches[0].clientX;
             startY = e.touches[0].clientY;
             currentX = startX;
             currentY = startY;
             cardInitialTransform = currentCard.style.transform;
+            currentCard.classList.add('dragging');
         }
         
         function handleMouseDown(e) {
             if (keyboardActive) return;
             currentCard = e.target.closest('.swipe-card');
+            if (!currentCard) return;
             startX = e.clientX;
             startY = e.clientY;
             currentX = startX;
             currentY = startY;
             cardInitialTransform = currentCard.style.transform;
+            currentCard.classList.add('dragging');
             e.preventDefault();
         }
         
@@ -721,7 +657,7 @@ class SwipeInterface:
             
             currentX = e.touches[0].clientX;
             currentY = e.touches[0].clientY;
-            updateCardPosition();
+            scheduleCardUpdate();
         }
         
         function handleMouseMove(e) {
@@ -730,7 +666,17 @@ class SwipeInterface:
             
             currentX = e.clientX;
             currentY = e.clientY;
-            updateCardPosition();
+            scheduleCardUpdate();
+        }
+        
+        // Pointer events can outpace the display; move the card at most once a frame
+        function scheduleCardUpdate() {
+            if (rafPending) return;
+            rafPending = true;
+            requestAnimationFrame(() => {
+                rafPending = false;
+                if (currentCard) updateCardPosition();
+            });
         }
         
         function updateCardPosition() {
@@ -738,7 +684,7 @@ class SwipeInterface:
             const deltaY = currentY - startY;
             const rotation = deltaX * 0.1;
             
-            currentCard.style.transform = `translateX(${deltaX}px) translateY(${deltaY}px) rotate(${rotation}deg)`;
+            currentCard.style.setProperty('transform', `translateX(${deltaX}px) translateY(${deltaY}px) rotate(${rotation}deg)`);
             
             // Show swipe indicators
             const leftIndicator = currentCard.querySelector('.left-indicator');
@@ -774,6 +720,9 @@ class SwipeInterface:
             const deltaX = currentX - startX;
             const deltaY = currentY - startY;
             
+            // Let the release (snap back or fly off) animate again
+            currentCard.classList.remove('dragging');
+            
             // Reset indicators
             const leftIndicator = currentCard.querySelector('.left-indicator');
             const rightIndicator = currentCard.querySelector('.right-indicator');
@@ -938,6 +887,12 @@ class SwipeInterface:
         }
         
         function loadNextCard() {
+            // Keep the stack topped up from the queued cards
+            const next = upcomingCards.shift();
+            if (next) {
+                document.querySelector('.swipe-container').insertAdjacentHTML('beforeend', next);
+            }
+            
             // Signal to load next card
             window.parent.postMessage({
                 type: 'load_next_card'
@@ -949,6 +904,169 @@ class SwipeInterface:
         setTimeout(initializeSwipe, 100);
         </script>
         """
+
+
+# Swipe card markup, compiled once; autoescape keeps titles and overviews inert
+_CARD_TEMPLATE = jinja2.Environment(autoescape=True).from_string("""
+        <div id="card-{{ card_id }}" class="swipe-card" data-movie-id="{{ movie_id }}" data-movie-type="{{ movie_type }}">
+            <div class="card-content">
+                <div class="poster-section">
+                    {% if poster_url %}<img src="{{ poster_url }}" class="poster-img" alt="Poster" width="400" height="300" loading="lazy" decoding="async" fetchpriority="{{ 'high' if card_id == '0' else 'low' }}" onerror="this.style.display='none'">{% endif %}
+                    <div class="poster-fallback">🎬</div>
+                </div>
+                
+                <div class="info-section">
+                    <h2 class="movie-title">{{ title }}</h2>
+                    
+                    <div class="movie-meta">
+                        <span class="year">📅 {{ year }}</span>
+                        <span class="rating">⭐ {{ '%.1f' | format(vote) }}/10</span>
+                        <span class="type">{{ '🎬 Movie' if movie_type == 'movie' else '📺 TV' }}</span>
+                    </div>
+                    
+                    {% if rec_reason %}<div class="rec-reason">🎯 {{ rec_reason }} ({{ match_score }}% match)</div>{% endif %}
+                    
+                    <div class="genres">{{ genres }}</div>
+                    
+                    <div class="overview">{{ overview }}...</div>
+                </div>
+            </div>
+            
+            <div class="action-buttons">
+                <button class="btn btn-havent-seen" onclick="handleHaventSeen('{{ card_id }}')">
+                    🤷 Haven't Seen
+                </button>
+                <button class="btn btn-have-seen" onclick="handleHaveSeen('{{ card_id }}')">
+                    👀 Have Seen
+                </button>
+            </div>
+            
+            <!-- Mobile-friendly extended actions -->
+            <div class="extended-actions">
+                <button class="btn btn-watchlist" onclick="handleWatchlist('{{ card_id }}')">
+                    📋 Watchlist
+                </button>
+                <button class="btn btn-skip" onclick="handleSkip('{{ card_id }}')">
+                    ⏭️ Skip
+                </button>
+            </div>
+            
+            <div class="rating-mode" id="rating-mode-{{ card_id }}" style="display: none;">
+                <div class="rating-instruction">
+                    <p>👈 Swipe left: Didn't like it</p>
+                    <p>👉 Swipe right: Liked it</p>
+                </div>
+                <div class="quick-rate-buttons">
+                    <button class="btn btn-hate" onclick="quickRate('{{ card_id }}', 1)">😤 Hate</button>
+                    <button class="btn btn-ok" onclick="quickRate('{{ card_id }}', 2)">🤷 OK</button>
+                    <button class="btn btn-good" onclick="quickRate('{{ card_id }}', 3)">👍 Good</button>
+                    <button class="btn btn-perfect" onclick="quickRate('{{ card_id }}', 4)">🌟 Perfect</button>
+                </div>
+            </div>
+            
+            <!-- Swipe indicators -->
+            <div class="swipe-indicator left-indicator" id="left-indicator-{{ card_id }}">
+                <div class="indicator-content">
+                    <span class="indicator-text" id="left-text-{{ card_id }}">❌</span>
+                </div>
+            </div>
+            <div class="swipe-indicator right-indicator" id="right-indicator-{{ card_id }}">
+                <div class="indicator-content">
+                    <span class="indicator-text" id="right-text-{{ card_id }}">✅</span>
+                </div>
+            </div>
+        </div>
+""")
+
+
+# Cards kept in the swipe component's DOM; the first is the one being rated
+_DECK_SIZE = 3
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def _render_card(
+    movie_id: int,
+    movie_type: str,
+    title: str,
+    poster_url: str,
+    year: str,
+    vote: float,
+    overview: str,
+    genres: str,
+    rec_reason: str,
+    match_score: int,
+    card_id: str,
+) -> str:
+    """Swipe card HTML, memoized on the card's displayed fields"""
+    return _CARD_TEMPLATE.render(
+        card_id=card_id,
+        movie_id=movie_id,
+        movie_type=movie_type,
+        title=title,
+        poster_url=poster_url,
+        year=year,
+        vote=vote,
+        overview=overview,
+        genres=genres,
+        rec_reason=rec_reason,
+        match_score=match_score,
+    )
+
+
+class SwipeInterface:
+    """
+    Mobile-first swipe interface for rating movies.
+    Tinder-style swipe gestures with intelligent rating logic.
+    """
+    
+    def __init__(self, ratings_manager: EnhancedRatingsManager):
+        self.ratings_manager = ratings_manager
+        self.tmdb = get_tmdb_api()
+        
+    def create_swipe_card_html(self, item: Dict, card_id: str) -> str:
+        """Generate HTML for a swipeable movie card"""
+        poster_url = f"{TMDB_IMAGE_BASE_URL}{item['poster_path']}" if item.get('poster_path') else ""
+        
+        # Calculate recommendation info
+        rec_reason = item.get('rec_reason', '')
+        match_score = int(item.get('final_score', 0.5) * 100)
+        
+        genres = ", ".join(item.get('genres', [])) if isinstance(item.get('genres'), list) else str(item.get('genres', ''))
+        
+        return _render_card(
+            item['id'],
+            item['type'],
+            item['title'],
+            poster_url,
+            (item.get('release_date') or 'N/A')[:4],
+            float(item.get('vote_average') or 0),
+            (item.get('overview') or 'No description available')[:200],
+            genres,
+            rec_reason,
+            match_score,
+            card_id,
+        )
+    
+    def get_swipe_css(self) -> str:
+        """CSS for the swipe interface"""
+        return _SWIPE_CSS
+    
+    def get_swipe_javascript(self) -> str:
+        """JavaScript for swipe functionality"""
+        return _SWIPE_JS
+    
+    def render_deck(self, items: List[Dict]) -> str:
+        """HTML for a stack of swipe cards with the CSS and JavaScript included once"""
+        cards = [
+            self.create_swipe_card_html(item, str(i)) for i, item in enumerate(items)
+        ]
+        # Only the top of the deck goes in the DOM; the rest wait as JSON
+        # (with "</" escaped so card markup can't close the script tag)
+        upcoming = json.dumps(cards[_DECK_SIZE:]).replace("</", "<\\/")
+        return (
+            f'{_SWIPE_CSS}<div class="swipe-container">{"".join(cards[:_DECK_SIZE])}</div>'
+            f'<script id="deck-data" type="application/json">{upcoming}</script>{_SWIPE_JS}'
+        )
     
     def render_swipe_interface(self, recommendations: List[Dict], key: str = "swipe"):
         """Render the swipe interface with recommendations"""
@@ -960,21 +1078,9 @@ class SwipeInterface:
         current_rec = recommendations[0] if recommendations else None
         
         if current_rec:
-            # Create the swipe card HTML
-            card_html = self.create_swipe_card_html(current_rec, "current")
-            
-            # Combine CSS, HTML, and JavaScript
-            full_html = f"""
-            {self.get_swipe_css()}
-            <div class="swipe-container">
-                {card_html}
-            </div>
-            {self.get_swipe_javascript()}
-            """
-            
             # Render the component (simplified for stability)
             try:
-                components.html(full_html, height=650)
+                components.html(self.render_deck(recommendations), height=650)
             except Exception as e:
                 st.error(f"Swipe interface error: {e}")
                 st.markdown("**Fallback: Basic card view**")
@@ -1052,8 +1158,7 @@ def create_swipe_page():
     swipe_interface = SwipeInterface(st.session_state.ratings_manager)
     
     # Get fresh recommendations
-    if 'swipe_recommendations' not in st.session_state:
-        st.session_state.swipe_recommendations = []
+    st.session_state.setdefault('swipe_recommendations', [])
     
     # Load more recommendations if needed
     if len(st.session_state.swipe_recommendations) < 5:
@@ -3,10 +3,13 @@ UI Components for FILMY app
 Reusable components to reduce code duplication
 """
 
+import os
 import streamlit as st
 from typing import Dict, Optional
 from core.config import TMDB_IMAGE_BASE_URL, RATING_LABELS
 
+CSS_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "styles.css")
+
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def get_poster_html(width: int, fallback: str = "🎬") -> str:
@@ -169,23 +172,24 @@ def render_card_content(item: Dict, show_rec_reason: bool) -> None:
         st.markdown(f"**Your Rating:** {rating_label}")
 
 
-@st.cache_data
+# CSS class per rating, indexed by rating + 2 (ratings run -2..4)
+RATING_CSS_CLASSES = (
+    "watchlist-item",
+    "not-interested",
+    "want-to-see",
+    "didnt-like-it",
+    "it-was-ok",
+    "liked-it",
+    "loved-it",
+)
+
+
 def get_card_css_class(my_rating: Optional[int]) -> str:
-    """Get CSS class based on user rating - cached"""
+    """Get CSS class based on user rating"""
     if my_rating is None:
         return ""
-    
-    rating_classes = {
-        4: "loved-it",
-        3: "liked-it", 
-        2: "it-was-ok",
-        1: "didnt-like-it",
-        0: "want-to-see",
-        -1: "not-interested",
-        -2: "watchlist-item"
-    }
-    
-    return rating_classes.get(my_rating, "")
+    i = int(my_rating) + 2
+    return RATING_CSS_CLASSES[i] if 0 <= i < len(RATING_CSS_CLASSES) else ""
 
 
 def render_rating_buttons(item: Dict, key_prefix: str) -> None:
@@ -300,11 +304,19 @@ def render_page_header(title: str, subtitle: str = "") -> None:
         )
 
 
+@st.cache_resource
+def _css_blob() -> str:
+    """Read the stylesheet once per process"""
+    with open(CSS_PATH) as f:
+        return f"<style>{f.read()}</style>"
+
+
 def load_css() -> None:
     """Load CSS from external file with error handling"""
     try:
-        with open("src/assets/styles.css") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+        # Streamlit drops elements a rerun does not emit, so the cached
+        # style block is still written every run
+        st.markdown(_css_blob(), unsafe_allow_html=True)
     except FileNotFoundError:
         st.warning("CSS file not found - using default styling")
     except Exception as e:
@@ -17,6 +17,9 @@ if not TMDB_API_KEY:
         pass
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
+TMDB_IMAGE_ROOT_URL = "https://image.tmdb.org/t/p/"
+# Poster widths TMDB serves (as /w{size}/ path segments), smallest first
+TMDB_POSTER_SIZES = (92, 154, 185, 342, 500, 780)
 
 # Google Sheets Configuration
 GOOGLE_CREDENTIALS_FILE = os.getenv(
@@ -25,6 +28,17 @@ GOOGLE_CREDENTIALS_FILE = os.getenv(
 GOOGLE_SHEET_ID = "1cEGSoX7b1458QAQn1ORLPlrqXVI9-hDqqjp7LL9kpOc"
 GOOGLE_WORKSHEET_NAME = os.getenv("GOOGLE_WORKSHEET_NAME", "Sheet1")
 
+# Ratings worker - optional external endpoint that persists ratings to Sheets
+# asynchronously so the Streamlit script thread never blocks on the Sheets API
+RATINGS_WORKER_URL = os.getenv("RATINGS_WORKER_URL")
+RATINGS_WORKER_USER_ID = os.getenv("RATINGS_WORKER_USER_ID", "default_user")
+RATINGS_WORKER_TIMEOUT = 0.5  # seconds - the worker only has to accept the job
+
+# New ratings are appended to Sheets in batches of this size (one API call each)
+SHEETS_BATCH_SIZE = int(os.getenv("SHEETS_BATCH_SIZE", "5"))
+# ...or after this many seconds, whichever comes first
+SHEETS_FLUSH_INTERVAL = float(os.getenv("SHEETS_FLUSH_INTERVAL", "5"))
+
 # App Configuration
 APP_TITLE = "🎬 FILMY - Your Personal Movie & TV Recommendation Engine"
 APP_ICON = "🎬"
@@ -1,6 +1,6 @@
 import random
 from typing import Dict, List, Optional
-from .tmdb_api import TMDBApi
+from .tmdb_api import TMDBApi, fetch_concurrently
 from .recommendation_engine import IntelligentRecommendationEngine
 
 
@@ -47,40 +47,47 @@ class DynamicRecommendationManager:
     
     def _refresh_recommendation_pools(self):
         """Refresh all recommendation pools"""
-        try:
+        # pool -> (refill below this size, source); sources are independent
+        # TMDB round-trips, so the low pools are fetched concurrently
+        sources = {
             # 1. Intelligent recommendations (best quality)
-            if len(self.recommendation_pools['intelligent']) < 10:
-                intelligent_recs = self.intelligent_engine.get_personalized_recommendations(30)
-                self.recommendation_pools['intelligent'].extend(
-                    [r for r in intelligent_recs if not self._is_used(r)]
-                )
-            
+            'intelligent': (
+                10, lambda: self.intelligent_engine.get_personalized_recommendations(30)
+            ),
             # 2. Trending content (current hot stuff)
-            if len(self.recommendation_pools['trending']) < 15:
-                trending_recs = self._get_trending_content()
-                self.recommendation_pools['trending'].extend(
-                    [r for r in trending_recs if not self._is_used(r)]
-                )
-            
+            'trending': (15, self._get_trending_content),
             # 3. Popular content (reliable quality)
-            if len(self.recommendation_pools['popular']) < 20:
-                popular_recs = self._get_popular_content()
-                self.recommendation_pools['popular'].extend(
-                    [r for r in popular_recs if not self._is_used(r)]
-                )
-            
+            'popular': (20, self._get_popular_content),
             # 4. Discovery content (explore new genres/years)
-            if len(self.recommendation_pools['discovery']) < 25:
-                discovery_recs = self._get_discovery_content()
-                self.recommendation_pools['discovery'].extend(
-                    [r for r in discovery_recs if not self._is_used(r)]
-                )
-            
+            'discovery': (25, self._get_discovery_content),
             # 5. Genre deep dives (based on user preferences)
-            if len(self.recommendation_pools['genre_deep_dive']) < 15:
-                genre_recs = self._get_genre_deep_dive()
-                self.recommendation_pools['genre_deep_dive'].extend(
-                    [r for r in genre_recs if not self._is_used(r)]
+            'genre_deep_dive': (15, self._get_genre_deep_dive),
+        }
+
+        def guarded(pool_name, source):
+            # One failing source must not discard the pools that did load
+            def call():
+                try:
+                    return source()
+                except Exception as e:
+                    print(f"Error refreshing {pool_name} pool: {e}")
+                    return None
+            return call
+
+        try:
+            low_pools = [
+                pool_name
+                for pool_name, (minimum, _) in sources.items()
+                if len(self.recommendation_pools[pool_name]) < minimum
+            ]
+            fetched = fetch_concurrently(
+                *(guarded(pool_name, sources[pool_name][1]) for pool_name in low_pools)
+            )
+
+            # Filtering and pool updates stay on this thread
+            for pool_name, recs in zip(low_pools, fetched):
+                self.recommendation_pools[pool_name].extend(
+                    [r for r in recs or [] if not self._is_used(r)]
                 )
                 
         except Exception as e:
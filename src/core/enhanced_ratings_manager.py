@@ -1,10 +1,35 @@
 import pandas as pd
+import requests
 import streamlit as st
+import atexit
+import functools
 import os
+import threading
+import time
 from typing import Dict, List
 from datetime import datetime
 from .google_sheets_manager import GoogleSheetsManager
-from .config import RATING_SYSTEM, RATING_LABELS, CSV_HEADERS
+from .config import (
+    RATING_SYSTEM,
+    RATING_LABELS,
+    CSV_HEADERS,
+    RATINGS_WORKER_URL,
+    RATINGS_WORKER_USER_ID,
+    RATINGS_WORKER_TIMEOUT,
+    SHEETS_BATCH_SIZE,
+    SHEETS_FLUSH_INTERVAL,
+)
+
+
+def _locked(method):
+    """Serialize a mutating method on the manager's lock"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class EnhancedRatingsManager:
@@ -15,8 +40,24 @@ class EnhancedRatingsManager:
 
     def __init__(self, csv_file: str = "filmy_ratings.csv"):
         self.csv_file = csv_file
+        # One instance may be shared by every session (st.cache_resource)
+        self._lock = threading.RLock()
+        self._rating_map = None
+        # Bumped on every save so callers can key caches on it. Seeded from
+        # the clock so a rebuilt manager never reuses an old instance's keys
+        # in st.cache_data (which outlives cache_resource clears and reloads)
+        self.version = time.monotonic_ns()
         self.df = self.load_csv()
         self.google_sheets = GoogleSheetsManager()
+        # New rows waiting to be appended to Sheets in one batch
+        self._pending_sheet_rows = []
+        # Edits/deletions of rows already in Sheets: (tmdb_id, type) -> values or None
+        self._pending_sheet_changes = {}
+        # Background timer that flushes the queue SHEETS_FLUSH_INTERVAL after a write
+        self._flush_timer = None
+        # Serializes flushes, so a later batch can't overtake an earlier one
+        self._flush_lock = threading.Lock()
+        atexit.register(self.flush_sheet_writes)
 
         # Sync with Google Sheets on startup if available
         if self.google_sheets.is_connected():
@@ -44,11 +85,15 @@ class EnhancedRatingsManager:
 
     def save_csv(self):
         """Save ratings to CSV file"""
+        # Every mutation goes through here, so drop the memoized lookups
+        self._rating_map = None
+        self.version += 1
         try:
             self.df.to_csv(self.csv_file, index=False)
         except Exception as e:
             st.error(f"Error saving CSV: {e}")
 
+    @_locked
     def add_rating(
         self,
         tmdb_id: int,
@@ -114,16 +159,145 @@ class EnhancedRatingsManager:
         self.df = pd.concat([self.df, new_row], ignore_index=True)
         self.save_csv()
 
-        # Sync to Google Sheets if connected
-        if self.google_sheets.is_connected():
-            self.google_sheets.add_rating(rating_data)
+        # Sync to Google Sheets (through the ratings worker when configured)
+        self._push_rating(rating_data)
 
         return True
 
+    def _push_rating(self, rating_data: Dict):
+        """Hand a new rating to the ratings worker, or write it to Sheets directly"""
+        if RATINGS_WORKER_URL:
+            self._post_to_worker({"action": "add", **rating_data})
+            return
+
+        if self.google_sheets.is_connected():
+            self._pending_sheet_rows.append(rating_data)
+            full = len(self._pending_sheet_rows) >= SHEETS_BATCH_SIZE
+            self._schedule_sheet_flush(0 if full else SHEETS_FLUSH_INTERVAL)
+
+    def _post_to_worker(self, payload: Dict):
+        """Send one rating change to the ratings worker"""
+        try:
+            response = requests.post(
+                RATINGS_WORKER_URL,
+                json={"user_id": RATINGS_WORKER_USER_ID, **payload},
+                timeout=RATINGS_WORKER_TIMEOUT,
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            # A toast survives the caller's st.rerun(), a warning would not
+            st.toast(f"⚠️ Ratings worker unavailable, but saved locally: {e}")
+
+    def _queue_sheet_change(self, tmdb_id, content_type: str, values):
+        """Queue an edit (or deletion, when values is None) for the next Sheets flush"""
+        # With a worker configured it owns the sheet, so edits and deletions
+        # go to it too and arrive after the add they apply to
+        if RATINGS_WORKER_URL:
+            payload = {"action": "delete", "tmdb_id": int(tmdb_id), "type": content_type}
+            if values is not None:
+                rating, label, date_rated = values
+                payload.update(
+                    action="update",
+                    my_rating=int(rating),
+                    my_rating_label=label,
+                    date_rated=date_rated,
+                )
+            self._post_to_worker(payload)
+            return
+
+        if not self.google_sheets.is_connected():
+            return
+
+        # A row that hasn't been appended yet is simply changed in the queue
+        if self._change_pending_row(tmdb_id, content_type, values):
+            return
+
+        self._pending_sheet_changes[(str(int(tmdb_id)), content_type)] = values
+        pending = len(self._pending_sheet_rows) + len(self._pending_sheet_changes)
+        full = pending >= SHEETS_BATCH_SIZE
+        self._schedule_sheet_flush(0 if full else SHEETS_FLUSH_INTERVAL)
+
+    def _change_pending_row(self, tmdb_id, content_type: str, values) -> bool:
+        """Edit or drop a queued, not yet appended row - False if none matches"""
+        key = str(int(tmdb_id))
+        for i, row in enumerate(self._pending_sheet_rows):
+            if str(int(row["tmdb_id"])) == key and row["type"] == content_type:
+                if values is None:
+                    del self._pending_sheet_rows[i]
+                else:
+                    row["my_rating"], row["my_rating_label"], row["date_rated"] = values
+                return True
+        return False
+
+    def _schedule_sheet_flush(self, delay: float = SHEETS_FLUSH_INTERVAL):
+        """Flush the Sheets queue on a background timer after delay seconds"""
+        # A partial batch must not wait for more ratings - the container
+        # (and the atexit hook with it) can be killed at any time. A full
+        # batch goes out straight away, but still off the user's script thread.
+        if self._flush_timer is not None and delay == 0:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(delay, self._timed_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _timed_flush(self):
+        """Timer callback - flush the queue, retrying on the next interval if Sheets fails"""
+        with self._lock:
+            # A full batch may already have replaced this timer with a newer one
+            if self._flush_timer is threading.current_thread():
+                self._flush_timer = None
+
+        if not self.flush_sheet_writes():
+            # No script context on this thread, so st.* output would be dropped
+            print(
+                f"Google Sheets flush failed - retrying in {SHEETS_FLUSH_INTERVAL:g}s"
+            )
+            with self._lock:
+                self._schedule_sheet_flush()
+
+    def flush_sheet_writes(self) -> bool:
+        """Write queued edits, deletions and new ratings to Google Sheets"""
+        with self._flush_lock:
+            # Only the hand-off happens under the manager lock; the Sheets
+            # round-trips below don't hold up other sessions' reads and writes
+            with self._lock:
+                changes, rows = self._pending_sheet_changes, self._pending_sheet_rows
+                self._pending_sheet_changes, self._pending_sheet_rows = {}, []
+
+            # Changes only ever target rows already in the sheet, so apply them
+            # before appending rows that may re-add a just-deleted title
+            if changes and not self.google_sheets.apply_changes(changes):
+                self._requeue_sheet_writes(changes, rows)
+                return False
+
+            if rows and not self.google_sheets.add_ratings(rows):
+                self._requeue_sheet_writes({}, rows)
+                return False
+
+            return True
+
+    @_locked
+    def _requeue_sheet_writes(self, changes: Dict, rows: List[Dict]):
+        """Put a failed flush back ahead of anything queued while it ran"""
+        newer_changes = self._pending_sheet_changes
+        self._pending_sheet_changes = changes
+        self._pending_sheet_rows = rows + self._pending_sheet_rows
+
+        # Changes queued meanwhile may target rows that are unsent again
+        for (tmdb_id, content_type), values in newer_changes.items():
+            if not self._change_pending_row(tmdb_id, content_type, values):
+                self._pending_sheet_changes[(tmdb_id, content_type)] = values
+
+    @_locked
     def update_rating(
         self, tmdb_id: int, content_type: str, new_rating: int, custom_label: str = None
     ) -> bool:
         """Update existing rating"""
+        if not self.is_already_rated(tmdb_id, content_type):
+            return False
+
         mask = (self.df["tmdb_id"] == tmdb_id) & (self.df["type"] == content_type)
 
         if mask.any():
@@ -140,23 +314,27 @@ class EnhancedRatingsManager:
                 }
                 rating_label = special_labels.get(new_rating, "Unknown")
 
+            date_rated = datetime.now().isoformat()
             self.df.loc[mask, "my_rating"] = new_rating
             self.df.loc[mask, "my_rating_label"] = rating_label
-            self.df.loc[mask, "date_rated"] = datetime.now().isoformat()
+            self.df.loc[mask, "date_rated"] = date_rated
             self.save_csv()
 
-            # Update in Google Sheets
-            if self.google_sheets.is_connected():
-                self.google_sheets.update_rating(
-                    tmdb_id, content_type, new_rating, rating_label
-                )
+            # Update in Google Sheets on the next batched flush
+            self._queue_sheet_change(
+                tmdb_id, content_type, (new_rating, rating_label, date_rated)
+            )
 
             return True
 
         return False
 
+    @_locked
     def delete_rating(self, tmdb_id: int, content_type: str) -> bool:
         """Delete a rating"""
+        if not self.is_already_rated(tmdb_id, content_type):
+            return False
+
         mask = (self.df["tmdb_id"] == tmdb_id) & (self.df["type"] == content_type)
 
         if mask.any():
@@ -164,22 +342,60 @@ class EnhancedRatingsManager:
             self.df = self.df[~mask]
             self.save_csv()
 
-            # Delete from Google Sheets
-            if self.google_sheets.is_connected():
-                return self.google_sheets.delete_rating(tmdb_id, content_type)
+            # Delete from Google Sheets on the next batched flush
+            self._queue_sheet_change(tmdb_id, content_type, None)
 
             return True
 
         return False
 
+    @_locked
+    def delete_ratings(self, items: List[tuple]) -> int:
+        """Delete several (tmdb_id, type) ratings with one save, returns the count removed"""
+        rated = self.get_rating_map()
+        targets = {(int(i), t) for i, t in items if (int(i), t) in rated}
+        if not targets:
+            return 0
+
+        ids = pd.to_numeric(self.df["tmdb_id"], errors="coerce")
+        mask = pd.Series(False, index=self.df.index)
+        for content_type in {t for _, t in targets}:
+            type_ids = [i for i, t in targets if t == content_type]
+            mask |= (self.df["type"] == content_type) & ids.isin(type_ids)
+
+        # Remove from local DataFrame and persist once for the whole batch
+        self.df = self.df[~mask]
+        self.save_csv()
+
+        for tmdb_id, content_type in targets:
+            self._queue_sheet_change(tmdb_id, content_type, None)
+
+        return len(targets)
+
     def is_already_rated(self, tmdb_id: int, content_type: str) -> bool:
         """Check if content is already rated (prevents duplicates)"""
-        if self.df.empty:
-            return False
+        # Hash probe into the memoized map instead of scanning the frame
+        return (int(tmdb_id), content_type) in self.get_rating_map()
+
+    @_locked
+    def get_rating_map(self) -> Dict[tuple, int]:
+        """Get {(tmdb_id, type): my_rating} for all ratings, memoized until the next save"""
+        # Built under the lock so another session's save can't leave a stale memo
+        if self._rating_map is None and self.df.empty:
+            self._rating_map = {}
+        elif self._rating_map is None:
+            rated = self.df.dropna(subset=["tmdb_id"])
+            self._rating_map = dict(
+                zip(
+                    zip(rated["tmdb_id"].astype(int).tolist(), rated["type"].tolist()),
+                    rated["my_rating"].tolist(),
+                )
+            )
+        return self._rating_map
 
-        return not self.df[
-            (self.df["tmdb_id"] == tmdb_id) & (self.df["type"] == content_type)
-        ].empty
+    def get_rated_id_set(self) -> frozenset:
+        """Get all rated (tmdb_id, type) pairs"""
+        return frozenset(self.get_rating_map())
 
     def get_rated_ids(self, content_type: str = None) -> List[int]:
         """Get list of all rated TMDB IDs (for filtering recommendations)"""
@@ -209,16 +425,7 @@ class EnhancedRatingsManager:
 
     def get_user_rating(self, tmdb_id: int, content_type: str) -> int:
         """Get user's rating for a specific item"""
-        if self.df.empty:
-            return None
-
-        mask = (self.df["tmdb_id"] == tmdb_id) & (self.df["type"] == content_type)
-        matches = self.df[mask]
-
-        if not matches.empty:
-            return matches.iloc[0]["my_rating"]
-
-        return None
+        return self.get_rating_map().get((int(tmdb_id), content_type))
 
     def get_ratings_by_score(
         self, min_score: int, content_type: str = None
@@ -310,16 +517,25 @@ class EnhancedRatingsManager:
         if not self.google_sheets.is_connected():
             return
 
-        try:
-            remote_df = self.google_sheets.get_all_ratings()
-            if not remote_df.empty:
-                # Merge with local data (remote takes precedence)
-                self.df = remote_df.copy()
-                self.save_csv()
-                st.success("✅ Synced data from Google Sheets!")
-        except Exception as e:
-            st.warning(f"Could not sync from Google Sheets: {e}")
+        # Push queued writes first so the pull doesn't drop them - and if
+        # they can't be pushed, keep the local data that still has them.
+        # Flushing takes the manager lock itself, so it runs before ours.
+        if not self.flush_sheet_writes():
+            st.warning("Could not push queued ratings to Google Sheets - keeping local data")
+            return
+
+        with self._lock:
+            try:
+                remote_df = self.google_sheets.get_all_ratings()
+                if not remote_df.empty:
+                    # Merge with local data (remote takes precedence)
+                    self.df = remote_df.copy()
+                    self.save_csv()
+                    st.success("✅ Synced data from Google Sheets!")
+            except Exception as e:
+                st.warning(f"Could not sync from Google Sheets: {e}")
 
+    @_locked
     def sync_to_google_sheets(self):
         """Sync local data to Google Sheets"""
         if not self.google_sheets.is_connected():
@@ -327,8 +543,10 @@ class EnhancedRatingsManager:
             return False
 
         try:
-            # Export current CSV to Google Sheets
+            # Export current CSV to Google Sheets - it already holds queued writes
             if os.path.exists(self.csv_file):
+                self._pending_sheet_rows = []
+                self._pending_sheet_changes = {}
                 return self.google_sheets.import_from_csv(self.csv_file)
         except Exception as e:
             st.error(f"Failed to sync to Google Sheets: {e}")
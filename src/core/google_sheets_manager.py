@@ -1,6 +1,8 @@
 import gspread
+from gspread.utils import rowcol_to_a1
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from google.oauth2.service_account import Credentials
 import json
 import os
@@ -15,6 +17,14 @@ from .config import (
 )
 
 
+def _report_error(message: str):
+    """st.error from a script run, or the server log from a background flush"""
+    if get_script_run_ctx(suppress_warning=True) is None:
+        print(message)
+    else:
+        st.error(message)
+
+
 class GoogleSheetsManager:
     """Manages Google Sheets integration for storing movie ratings"""
 
@@ -567,6 +577,22 @@ class GoogleSheetsManager:
         """Check if connected to Google Sheets"""
         return self.worksheet is not None
 
+    def _rating_row(self, rating_data: Dict) -> List:
+        """Order a rating's fields as a sheet row"""
+        return [
+            rating_data.get("tmdb_id", ""),
+            rating_data.get("title", ""),
+            rating_data.get("type", ""),
+            rating_data.get("release_date", ""),
+            ", ".join(rating_data.get("genres", [])),
+            rating_data.get("tmdb_rating", 0),
+            rating_data.get("my_rating", 0),
+            rating_data.get("my_rating_label", ""),
+            rating_data.get("date_rated", ""),
+            rating_data.get("overview", ""),
+            rating_data.get("poster_url", ""),
+        ]
+
     def add_rating(self, rating_data: Dict) -> bool:
         """Add a new rating to Google Sheets"""
         if not self.is_connected():
@@ -575,19 +601,7 @@ class GoogleSheetsManager:
         try:
             self._rate_limit()  # Rate limiting
             # Prepare row data in correct order
-            row_data = [
-                rating_data.get("tmdb_id", ""),
-                rating_data.get("title", ""),
-                rating_data.get("type", ""),
-                rating_data.get("release_date", ""),
-                ", ".join(rating_data.get("genres", [])),
-                rating_data.get("tmdb_rating", 0),
-                rating_data.get("my_rating", 0),
-                rating_data.get("my_rating_label", ""),
-                rating_data.get("date_rated", ""),
-                rating_data.get("overview", ""),
-                rating_data.get("poster_url", ""),
-            ]
+            row_data = self._rating_row(rating_data)
 
             self.worksheet.append_row(row_data)
 
@@ -600,6 +614,24 @@ class GoogleSheetsManager:
             st.error(f"Failed to add rating to Google Sheets: {e}")
             return False
 
+    def add_ratings(self, ratings: List[Dict]) -> bool:
+        """Append several ratings to Google Sheets in a single API call"""
+        if not self.is_connected():
+            return False
+        if not ratings:
+            return True
+
+        try:
+            self._rate_limit()  # Rate limiting
+            # Conditional formatting still colours the ratings; per-row
+            # styling is skipped because it costs five calls per row
+            self.worksheet.append_rows([self._rating_row(r) for r in ratings])
+            return True
+
+        except Exception as e:
+            _report_error(f"Failed to add ratings to Google Sheets: {e}")
+            return False
+
     def get_all_ratings(self) -> pd.DataFrame:
         """Get all ratings from Google Sheets"""
         if not self.is_connected():
@@ -680,6 +712,69 @@ class GoogleSheetsManager:
             st.error(f"Failed to update rating: {e}")
             return False
 
+    def apply_changes(self, changes: Dict) -> bool:
+        """Apply queued edits and deletions with one read and two batched writes
+
+        ``changes`` maps ``(tmdb_id, type)`` to ``(my_rating, my_rating_label,
+        date_rated)``, or to ``None`` to delete that row.
+        """
+        if not self.is_connected():
+            return False
+        if not changes:
+            return True
+
+        try:
+            self._rate_limit()  # Rate limiting
+            all_values = self.worksheet.get_all_values()
+            headers = all_values[0]
+            id_col = headers.index("tmdb_id")
+            type_col = headers.index("type")
+            # my_rating, my_rating_label and date_rated are adjacent columns
+            rating_col = headers.index("my_rating") + 1
+
+            updates = []
+            deleted_rows = []
+            for i, row in enumerate(all_values[1:], start=2):
+                key = (row[id_col], row[type_col])
+                if key not in changes:
+                    continue
+                values = changes[key]
+                if values is None:
+                    deleted_rows.append(i)
+                else:
+                    first = rowcol_to_a1(i, rating_col)
+                    last = rowcol_to_a1(i, rating_col + 2)
+                    updates.append({"range": f"{first}:{last}", "values": [list(values)]})
+
+            if updates:
+                self.worksheet.batch_update(updates)
+
+            if deleted_rows:
+                # Bottom-up so earlier deletions don't shift later row numbers
+                self.worksheet.spreadsheet.batch_update(
+                    {
+                        "requests": [
+                            {
+                                "deleteDimension": {
+                                    "range": {
+                                        "sheetId": self.worksheet.id,
+                                        "dimension": "ROWS",
+                                        "startIndex": row - 1,
+                                        "endIndex": row,
+                                    }
+                                }
+                            }
+                            for row in sorted(deleted_rows, reverse=True)
+                        ]
+                    }
+                )
+
+            return True
+
+        except Exception as e:
+            _report_error(f"Failed to apply rating changes to Google Sheets: {e}")
+            return False
+
     def delete_rating(self, tmdb_id: int, content_type: str) -> bool:
         """Delete a rating from Google Sheets"""
         if not self.is_connected():
@@ -738,10 +833,10 @@ class GoogleSheetsManager:
             self.worksheet.clear()
             self.worksheet.append_row(CSV_HEADERS)
 
-            # Add all rows
-            for _, row in df.iterrows():
-                row_data = [str(row.get(col, "")) for col in CSV_HEADERS]
-                self.worksheet.append_row(row_data)
+            # Add all rows in one request
+            rows = df.reindex(columns=CSV_HEADERS).fillna("").astype(str)
+            if not rows.empty:
+                self.worksheet.append_rows(rows.values.tolist())
 
             return True
 
@@ -1,10 +1,15 @@
 import requests
 import streamlit as st
-from typing import Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from .config import (
     TMDB_API_KEY,
     TMDB_BASE_URL,
     TMDB_IMAGE_BASE_URL,
+    TMDB_IMAGE_ROOT_URL,
+    TMDB_POSTER_SIZES,
     MOVIE_GENRES,
     TV_GENRES,
 )
@@ -96,12 +101,40 @@ LANGUAGE_MAPPING = {
     "nso": "Northern Sotho",
 }
 
+# Upper bound on simultaneous TMDB requests from one page render
+MAX_CONCURRENT_REQUESTS = 8
+
+# Overviews longer than this are cut for card display
+OVERVIEW_PREVIEW_LENGTH = 300
+
+
+def poster_url(path: str, width: int) -> str:
+    """URL for the smallest TMDB poster size that covers a display width
+
+    Accepts a bare TMDB path ("/abc.jpg") or a full image URL of any size.
+    """
+    if not path:
+        return ""
+    if path.startswith("http"):
+        path = path[path.rindex("/"):]
+    size = next((f"w{s}" for s in TMDB_POSTER_SIZES if s >= width), "original")
+    return f"{TMDB_IMAGE_ROOT_URL}{size}{path}"
+
+
+def shorten_overview(overview: str) -> str:
+    """Truncate an overview for card display"""
+    if len(overview) > OVERVIEW_PREVIEW_LENGTH:
+        return overview[:OVERVIEW_PREVIEW_LENGTH] + "..."
+    return overview
+
 
 class TMDBApi:
     def __init__(self):
         self.api_key = TMDB_API_KEY
         self.base_url = TMDB_BASE_URL
         self.image_base_url = TMDB_IMAGE_BASE_URL
+        # Reuse connections (keep-alive) across every request this instance makes
+        self.session = requests.Session()
 
         if not self.api_key:
             st.error(
@@ -117,7 +150,7 @@ class TMDBApi:
         params["api_key"] = self.api_key
 
         try:
-            response = requests.get(f"{self.base_url}{endpoint}", params=params)
+            response = self.session.get(f"{self.base_url}{endpoint}", params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -220,8 +253,11 @@ class TMDBApi:
             "title": movie.get("title", "Unknown Title"),
             "original_title": movie.get("original_title", ""),
             "overview": movie.get("overview", "No overview available"),
+            "overview_short": shorten_overview(
+                movie.get("overview") or "No overview available"
+            ),
             "release_date": movie.get("release_date", ""),
-            "vote_average": movie.get("vote_average", 0),
+            "vote_average": float(movie.get("vote_average") or 0),
             "vote_count": movie.get("vote_count", 0),
             "popularity": movie.get("popularity", 0),
             "poster_path": self.get_full_image_url(movie.get("poster_path")),
@@ -251,8 +287,11 @@ class TMDBApi:
             "title": tv_show.get("name", "Unknown Title"),
             "original_title": tv_show.get("original_name", ""),
             "overview": tv_show.get("overview", "No overview available"),
+            "overview_short": shorten_overview(
+                tv_show.get("overview") or "No overview available"
+            ),
             "release_date": tv_show.get("first_air_date", ""),
-            "vote_average": tv_show.get("vote_average", 0),
+            "vote_average": float(tv_show.get("vote_average") or 0),
             "vote_count": tv_show.get("vote_count", 0),
             "popularity": tv_show.get("popularity", 0),
             "poster_path": self.get_full_image_url(tv_show.get("poster_path")),
@@ -334,8 +373,42 @@ def get_tv_details_cached(tv_id: int) -> Optional[Dict]:
     return api._make_request(f"/tv/{tv_id}")
 
 
+@st.cache_resource
+def get_tmdb_api() -> TMDBApi:
+    """Shared TMDB client for every session of this server process"""
+    return TMDBApi()
+
+
 def _get_api_instance():
     """Get API instance for cached functions"""
-    if 'tmdb_api' not in st.session_state:
-        st.session_state.tmdb_api = TMDBApi()
-    return st.session_state.tmdb_api
+    return get_tmdb_api()
+
+
+@st.cache_resource
+def _request_pool() -> ThreadPoolExecutor:
+    """Shared worker pool for concurrent TMDB requests"""
+    return ThreadPoolExecutor(
+        max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="tmdb"
+    )
+
+
+def fetch_concurrently(*calls: Callable[[], Optional[Dict]]) -> List[Optional[Dict]]:
+    """Run blocking TMDB calls in parallel and return their results in order"""
+    if len(calls) < 2:
+        return [call() for call in calls]
+
+    ctx = get_script_run_ctx()
+
+    def run(call):
+        # Worker threads need the script context for st.* and session_state,
+        # but the pool is shared by every session - hand it back afterwards so
+        # an idle thread neither pins nor writes into this session
+        thread = threading.current_thread()
+        previous = get_script_run_ctx(suppress_warning=True)
+        add_script_run_ctx(thread, ctx)
+        try:
+            return call()
+        finally:
+            add_script_run_ctx(thread, previous)
+
+    return list(_request_pool().map(run, calls))
@@ -128,6 +128,15 @@ def log_user_action(action: str, details: Dict = None) -> None:
         pass
 
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_ratings(version: int):
+    """
+    All ratings as a DataFrame - cached until the ratings manager saves
+    Pass st.session_state.ratings_manager.version as the cache key
+    """
+    return st.session_state.ratings_manager.get_all_ratings()
+
+
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def get_user_stats() -> Dict:
     """Get user statistics for analytics - cached for performance"""